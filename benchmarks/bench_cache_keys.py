@@ -0,0 +1,52 @@
+"""
+Micro-benchmark of the per-call key overhead of Django's default cache key function
+and `pydantic_settings.cache.HashedKey`, on their own and through LocMemCache get/set
+calls (which also validate the key).
+
+    python benchmarks/bench_cache_keys.py
+"""
+
+import timeit
+import warnings
+
+from django.conf import settings
+
+settings.configure()
+
+from django.core.cache.backends.base import (  # noqa: E402
+    CacheKeyWarning,
+    default_key_func,
+)
+from django.core.cache.backends.locmem import LocMemCache  # noqa: E402
+
+from pydantic_settings.cache import HashedKey  # noqa: E402
+
+KEYS = {
+    "short": "user:42:profile",
+    "long": "views.decorators.cache.cache_page." + "x" * 300,
+}
+NUMBER = 100_000
+
+
+def bench(label, func):
+    seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+    print(f"{label:<40} {seconds / NUMBER * 1e9:8.0f} ns/call")
+
+
+def main():
+    warnings.simplefilter("ignore", CacheKeyWarning)
+    hashed_key = HashedKey()
+    for name, key in KEYS.items():
+        bench(f"default key function, {name} key", lambda: default_key_func(key, "", 1))
+        bench(f"HashedKey, {name} key", lambda: hashed_key(key, "", 1))
+        for label, key_func in (("default", None), ("HashedKey", hashed_key)):
+            cache = LocMemCache(
+                f"bench-{label}", {"KEY_FUNCTION": key_func} if key_func else {}
+            )
+            cache.set(key, 1)
+            bench(f"LocMemCache.get, {label}, {name} key", lambda: cache.get(key))
+            bench(f"LocMemCache.set, {label}, {name} key", lambda: cache.set(key, 1))
+
+
+if __name__ == "__main__":
+    main()
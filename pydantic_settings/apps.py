@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class PydanticSettingsConfig(AppConfig):
+    name = "pydantic_settings"
+    verbose_name = "Pydantic Settings"
+
+    def ready(self):
+        # Register the system checks.
+        from pydantic_settings import checks  # noqa: F401
@@ -0,0 +1,114 @@
+"""
+A file based cache that spreads its entries over subdirectories, used by
+`file+sharded://` cache URLs.
+
+Django's FileBasedCache keeps every entry in a single directory and lists all of
+them whenever it writes an entry past MAX_ENTRIES, so writes to a large cache stall.
+`ShardedFileBasedCache` stores the entry of a key in one of 65536 subdirectories
+(`ab/cd/abcd....djcache`) picked by a hash of the key, and culls one subdirectory at
+a time: a write only lists the subdirectory it writes to, and culls it when it holds
+more than its share of MAX_ENTRIES (at least one entry). MAX_ENTRIES is therefore
+approximate, and can't be lower than the number of subdirectories. Entries are
+written to a temporary file in their subdirectory and renamed into place, so readers
+never see a partially written entry.
+"""
+
+import os
+import pickle
+import tempfile
+import time
+from hashlib import blake2b
+from typing import List
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.filebased import FileBasedCache
+
+# Two levels of 256 subdirectories.
+SHARD_LEVELS = 2
+SHARD_COUNT = 256**SHARD_LEVELS
+
+
+class ShardedFileBasedCache(FileBasedCache):
+    def __init__(self, dir, params):
+        super().__init__(dir, params)
+        self._max_shard_entries = max(self._max_entries // SHARD_COUNT, 1)
+
+    def _key_to_file(self, key, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        digest = blake2b(key.encode(), digest_size=16).hexdigest()
+        shards = [digest[i * 2 : i * 2 + 2] for i in range(SHARD_LEVELS)]
+        return os.path.join(self._dir, *shards, digest + self.cache_suffix)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        fname = self._key_to_file(key, version)
+        shard = os.path.dirname(fname)
+        # The cache directory can be deleted at any time.
+        os.makedirs(shard, mode=0o700, exist_ok=True)
+        self._cull_shard(shard, fname)
+        fd, tmp_path = tempfile.mkstemp(dir=shard, suffix=".tmp")
+        renamed = False
+        try:
+            with open(fd, "wb") as f:
+                self._write_content(f, timeout, value)
+            os.replace(tmp_path, fname)
+            renamed = True
+        finally:
+            if not renamed:
+                os.remove(tmp_path)
+
+    def _cull(self):
+        # Culling is done per subdirectory by set().
+        pass
+
+    def _cull_shard(self, shard: str, fname: str) -> None:
+        """
+        Make room for `fname` in its subdirectory, deleting expired entries first,
+        and then the least recently written ones.
+        """
+        entries = []
+        try:
+            with os.scandir(shard) as it:
+                for entry in it:
+                    if entry.name.endswith(self.cache_suffix) and entry.path != fname:
+                        entries.append(entry)
+        except FileNotFoundError:
+            return
+        if len(entries) < self._max_shard_entries:
+            return
+        if self._cull_frequency == 0:
+            for entry in entries:
+                self._delete(entry.path)
+            return
+
+        now = time.time()
+        live = []
+        for entry in entries:
+            try:
+                with open(entry.path, "rb") as f:
+                    expiry = pickle.load(f)
+                mtime = entry.stat().st_mtime
+            except (OSError, EOFError, pickle.UnpicklingError):
+                continue
+            if expiry is not None and expiry < now:
+                self._delete(entry.path)
+            else:
+                live.append((mtime, entry.path))
+        excess = len(live) - self._max_shard_entries + 1
+        if excess <= 0:
+            return
+        live.sort()
+        count = max(excess, len(live) // self._cull_frequency)
+        for _, path in live[:count]:
+            self._delete(path)
+
+    def _list_cache_files(self) -> List[str]:
+        """Return the paths of all the cache files, in all the subdirectories."""
+        files = []
+        for root, _, names in os.walk(self._dir):
+            files.extend(
+                os.path.join(root, name)
+                for name in names
+                if name.endswith(self.cache_suffix)
+            )
+        return files
@@ -0,0 +1,193 @@
+"""
+A local memory cache bounded by the size of its entries, used by `locmem+bounded://`
+cache URLs.
+
+Django's LocMemCache only limits its number of entries (MAX_ENTRIES), so a few large
+values can grow a process well beyond its memory limit. `BoundedLocMemCache` keeps
+the pickled entries of a cache under `MAX_BYTES` (the pickled value plus the key),
+evicting the least recently used entries one at a time as needed. MAX_ENTRIES is
+only enforced when it is set explicitly. Like with LocMemCache, the entries are
+shared by all the instances of a cache with the same LOCATION in a process, and so
+are MAX_BYTES and MAX_ENTRIES: the limits of the most recently created instance
+apply to all of them.
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _Store:
+    """
+    The entries of a cache, most recently used last, their limits and their
+    statistics.
+    """
+
+    def __init__(self) -> None:
+        # key -> (pickled value, expiry time or None, size)
+        self.entries: "OrderedDict[str, Tuple[bytes, Optional[float], int]]" = (
+            OrderedDict()
+        )
+        self.lock = threading.Lock()
+        self.size = 0
+        self.max_bytes = DEFAULT_MAX_BYTES
+        self.max_entries: Optional[int] = None
+        self.hits = self.misses = self.evictions = 0
+
+
+_stores: Dict[str, _Store] = {}
+_stores_lock = threading.Lock()
+
+
+class BoundedLocMemCache(BaseCache):
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, name: str, params: Dict[str, Any]):
+        super().__init__(params)
+        options = params.get("OPTIONS") or {}
+        max_bytes = int(options.get("MAX_BYTES", DEFAULT_MAX_BYTES))
+        # BaseCache defaults MAX_ENTRIES to 300, which is too low for a cache bounded
+        # by size.
+        max_entries: Optional[int] = self._max_entries
+        if "MAX_ENTRIES" not in options and "max_entries" not in params:
+            max_entries = None
+        with _stores_lock:
+            self._store = _stores.setdefault(name, _Store())
+        with self._store.lock:
+            self._store.max_bytes = max_bytes
+            self._store.max_entries = max_entries
+
+    def _key(self, key: Any, version: Optional[int]) -> str:
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        return key
+
+    def _get_live(self, key: str) -> Optional[bytes]:
+        # Return the pickled value of an entry that hasn't expired, and mark it as
+        # the most recently used. Must be called with the lock held.
+        store = self._store
+        entry = store.entries.get(key)
+        if entry is None:
+            return None
+        pickled, expiry, size = entry
+        if expiry is not None and expiry <= time.time():
+            del store.entries[key]
+            store.size -= size
+            return None
+        store.entries.move_to_end(key)
+        return pickled
+
+    def _set(self, key: str, pickled: bytes, expiry: Optional[float]) -> bool:
+        # Must be called with the lock held.
+        store = self._store
+        self._delete(key)
+        size = len(key) + len(pickled)
+        if size > store.max_bytes:
+            return False
+        while store.entries and (
+            store.size + size > store.max_bytes
+            or (store.max_entries and len(store.entries) >= store.max_entries)
+        ):
+            _, (_, _, evicted_size) = store.entries.popitem(last=False)
+            store.size -= evicted_size
+            store.evictions += 1
+        store.entries[key] = (pickled, expiry, size)
+        store.size += size
+        return True
+
+    def _delete(self, key: str) -> bool:
+        store = self._store
+        entry = store.entries.pop(key, None)
+        if entry is None:
+            return False
+        store.size -= entry[2]
+        return True
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self._key(key, version)
+        pickled = pickle.dumps(value, self.pickle_protocol)
+        with self._store.lock:
+            if self._get_live(key) is not None:
+                return False
+            return self._set(key, pickled, self.get_backend_timeout(timeout))
+
+    def get(self, key, default=None, version=None):
+        key = self._key(key, version)
+        store = self._store
+        with store.lock:
+            pickled = self._get_live(key)
+            if pickled is None:
+                store.misses += 1
+                return default
+            store.hits += 1
+        return pickle.loads(pickled)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self._key(key, version)
+        pickled = pickle.dumps(value, self.pickle_protocol)
+        with self._store.lock:
+            self._set(key, pickled, self.get_backend_timeout(timeout))
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self._key(key, version)
+        store = self._store
+        with store.lock:
+            pickled = self._get_live(key)
+            if pickled is None:
+                return False
+            size = store.entries[key][2]
+            store.entries[key] = (pickled, self.get_backend_timeout(timeout), size)
+            return True
+
+    def incr(self, key, delta=1, version=None):
+        key = self._key(key, version)
+        with self._store.lock:
+            pickled = self._get_live(key)
+            if pickled is None:
+                raise ValueError("Key '%s' not found" % key)
+            new_value = pickle.loads(pickled) + delta
+            new_pickled = pickle.dumps(new_value, self.pickle_protocol)
+            if len(key) + len(new_pickled) > self._store.max_bytes:
+                # Keep the current value rather than losing the key.
+                raise ValueError("Key '%s' value is larger than MAX_BYTES" % key)
+            expiry = self._store.entries[key][1]
+            self._set(key, new_pickled, expiry)
+        return new_value
+
+    def has_key(self, key, version=None):
+        key = self._key(key, version)
+        with self._store.lock:
+            return self._get_live(key) is not None
+
+    def delete(self, key, version=None):
+        key = self._key(key, version)
+        with self._store.lock:
+            return self._delete(key)
+
+    def clear(self):
+        store = self._store
+        with store.lock:
+            store.entries.clear()
+            store.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the number of entries and bytes of the cache, and its hits, misses
+        and evictions since the process started.
+        """
+        store = self._store
+        with store.lock:
+            return {
+                "entries": len(store.entries),
+                "bytes": store.size,
+                "max_bytes": store.max_bytes,
+                "hits": store.hits,
+                "misses": store.misses,
+                "evictions": store.evictions,
+            }
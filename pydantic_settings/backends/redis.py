@@ -0,0 +1,106 @@
+"""
+Redis Sentinel and Redis Cluster support for Django's built-in redis cache backend
+(Django 4.0+), used by `redis+sentinel://` and `redis+cluster://` cache URLs.
+
+Both backends take the comma separated `host:port` addresses of the sentinels or
+cluster seed nodes as LOCATION.
+"""
+
+from django.core.cache.backends.redis import RedisCache, RedisCacheClient
+
+from pydantic_settings.networks import split_hosts
+
+
+def _nodes(servers, default_port):
+    return [
+        (host, int(port or default_port))
+        for server in servers
+        for host, port in split_hosts(server)
+    ]
+
+
+class SentinelRedisCacheClient(RedisCacheClient):
+    """
+    Connects to the master of a service monitored by Redis Sentinel, and reads from
+    its replicas if `read_from_replicas` is set.
+    """
+
+    def __init__(
+        self,
+        servers,
+        service_name,
+        sentinel_kwargs=None,
+        read_from_replicas=False,
+        **options,
+    ):
+        super().__init__(servers, **options)
+        from redis.sentinel import Sentinel
+
+        self._service_name = service_name
+        self._read_from_replicas = read_from_replicas
+        self._sentinel = Sentinel(
+            _nodes(servers, 26379), sentinel_kwargs=sentinel_kwargs
+        )
+
+    def _get_connection_pool(self, write):
+        from redis.sentinel import SentinelConnectionPool
+
+        is_master = write or not self._read_from_replicas
+        if is_master not in self._pools:
+            self._pools[is_master] = SentinelConnectionPool(
+                self._service_name,
+                self._sentinel,
+                is_master=is_master,
+                **self._pool_options,
+            )
+        return self._pools[is_master]
+
+
+class ClusterRedisCacheClient(RedisCacheClient):
+    """
+    Connects to a Redis Cluster. The cluster client routes every command to the node
+    owning its key, so multi-key operations are split per node.
+    """
+
+    def __init__(self, servers, **options):
+        super().__init__(servers, **options)
+        from redis.cluster import ClusterNode, RedisCluster
+
+        self._client = RedisCluster(
+            startup_nodes=[
+                ClusterNode(host, port) for host, port in _nodes(servers, 6379)
+            ],
+            **self._pool_options,
+        )
+
+    def get_client(self, key=None, *, write=False):
+        return self._client
+
+    def get_many(self, keys):
+        keys = list(keys)
+        ret = self.get_client(None).mget_nonatomic(keys)
+        return {
+            k: self._serializer.loads(v) for k, v in zip(keys, ret) if v is not None
+        }
+
+    def set_many(self, data, timeout):
+        # MSET can't span hash slots; a cluster pipeline sends each SET to its node.
+        pipeline = self.get_client(None, write=True).pipeline()
+        for key, value in data.items():
+            if timeout == 0:
+                pipeline.delete(key)
+            else:
+                pipeline.set(key, self._serializer.dumps(value), ex=timeout)
+        pipeline.execute()
+
+
+class RedisSentinelCache(RedisCache):
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        self._class = SentinelRedisCacheClient
+
+
+class RedisClusterCache(RedisCache):
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        self._class = ClusterRedisCacheClient
@@ -0,0 +1,236 @@
+"""
+SMTP email backend with a process-wide pool of persistent connections.
+
+Django's SMTP backend opens (and for TLS, negotiates) a new connection for every
+`send_mail()` call. `PooledEmailBackend` instead returns connections to a pool when
+it is closed, so subsequent messages to the same server reuse them. Connections are
+closed when they have been idle for `EMAIL_POOL_IDLE_TIMEOUT` seconds or have sent
+`EMAIL_POOL_MAX_MESSAGES` messages, and at most `EMAIL_POOL_SIZE` idle connections
+are kept per server.
+"""
+
+import atexit
+import smtplib
+import ssl
+import threading
+from collections import deque
+from time import monotonic
+from typing import Deque, Dict, Hashable, List, Optional
+
+from django.conf import settings
+from django.core.mail.backends import smtp
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_IDLE_TIMEOUT = 30.0
+DEFAULT_MAX_MESSAGES = 100
+
+
+class PooledConnection:
+    __slots__ = ("connection", "messages", "last_used", "reused", "broken")
+
+    def __init__(self, connection: smtplib.SMTP):
+        self.connection = connection
+        self.messages = 0
+        self.last_used = monotonic()
+        self.reused = False
+        self.broken = False
+
+
+def _quit(connection: smtplib.SMTP) -> None:
+    try:
+        connection.quit()
+    except (ssl.SSLError, smtplib.SMTPServerDisconnected):
+        connection.close()
+    except (smtplib.SMTPException, OSError):
+        pass
+
+
+class SMTPConnectionPool:
+    """A thread-safe LIFO pool of idle SMTP connections to one server."""
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+    ):
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.max_messages = max_messages
+        self._idle: Deque[PooledConnection] = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def acquire(self) -> Optional[PooledConnection]:
+        """Take the most recently used idle connection, if any hasn't expired."""
+        expired: List[PooledConnection] = []
+        pooled = None
+        now = monotonic()
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if now - candidate.last_used < self.idle_timeout:
+                    pooled = candidate
+                    break
+                expired.append(candidate)
+        for candidate in expired:
+            _quit(candidate.connection)
+        if pooled is not None:
+            pooled.reused = True
+        return pooled
+
+    def release(self, pooled: PooledConnection) -> None:
+        """
+        Return a connection to the pool, or close it if it is broken, has sent its
+        maximum number of messages or the pool is full.
+        """
+        pooled.last_used = monotonic()
+        closing: List[PooledConnection] = []
+        with self._lock:
+            # The oldest connections are at the left; drop any that have expired.
+            while (
+                self._idle
+                and pooled.last_used - self._idle[0].last_used >= self.idle_timeout
+            ):
+                closing.append(self._idle.popleft())
+            if (
+                pooled.broken
+                or pooled.messages >= self.max_messages
+                or len(self._idle) >= self.size
+            ):
+                closing.append(pooled)
+            else:
+                self._idle.append(pooled)
+        for candidate in closing:
+            _quit(candidate.connection)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for pooled in idle:
+            _quit(pooled.connection)
+
+
+_pools: Dict[Hashable, SMTPConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def close_pools() -> None:
+    """Close the idle connections of all pools."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close()
+
+
+def _setting(name: str, value, default):
+    if value is None:
+        value = getattr(settings, name, None)
+    return default if value is None else value
+
+
+class PooledEmailBackend(smtp.EmailBackend):
+    """
+    An SMTP email backend that takes its connection from a pool shared by all
+    instances connecting to the same server with the same credentials.
+
+    The pool size, idle timeout and maximum number of messages per connection can be
+    passed as `pool_size`, `idle_timeout` and `max_messages`, and default to the
+    EMAIL_POOL_SIZE, EMAIL_POOL_IDLE_TIMEOUT and EMAIL_POOL_MAX_MESSAGES settings.
+    They only apply when the pool for a server is created.
+    """
+
+    def __init__(
+        self,
+        *args,
+        pool_size: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        max_messages: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self._pooled: Optional[PooledConnection] = None
+        key = (
+            self.host,
+            self.port,
+            self.username,
+            self.password,
+            self.use_tls,
+            self.use_ssl,
+            self.ssl_certfile,
+            self.ssl_keyfile,
+            self.timeout,
+        )
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = SMTPConnectionPool(
+                    _setting("EMAIL_POOL_SIZE", pool_size, DEFAULT_POOL_SIZE),
+                    _setting(
+                        "EMAIL_POOL_IDLE_TIMEOUT", idle_timeout, DEFAULT_IDLE_TIMEOUT
+                    ),
+                    _setting(
+                        "EMAIL_POOL_MAX_MESSAGES", max_messages, DEFAULT_MAX_MESSAGES
+                    ),
+                )
+        self.pool = pool
+
+    def open(self):
+        if self.connection:
+            return False
+        pooled = self.pool.acquire()
+        if pooled is None:
+            created = super().open()
+            if not self.connection:
+                return created
+            pooled = PooledConnection(self.connection)
+        self.connection, self._pooled = pooled.connection, pooled
+        # Report a new connection, so that send_messages() closes (i.e. releases) it.
+        return True
+
+    def close(self):
+        pooled, self._pooled = self._pooled, None
+        if pooled is None:
+            return super().close()
+        self.connection = None
+        self.pool.release(pooled)
+
+    def _send(self, email_message):
+        if self._pooled is None:
+            return super()._send(email_message)
+        fail_silently, self.fail_silently = self.fail_silently, False
+        try:
+            try:
+                sent = super()._send(email_message)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                if not self._pooled.reused:
+                    raise
+                # The server dropped the connection while it was idle in the pool,
+                # retry once on a new connection.
+                self._reconnect()
+                sent = super()._send(email_message)
+        except OSError as exc:
+            if self._pooled is not None:
+                self._pooled.broken = True
+            if fail_silently and isinstance(exc, smtplib.SMTPException):
+                return False
+            raise
+        finally:
+            self.fail_silently = fail_silently
+        if sent:
+            self._pooled.messages += 1
+        return sent
+
+    def _reconnect(self) -> None:
+        pooled, self._pooled = self._pooled, None
+        self.connection = None
+        _quit(pooled.connection)
+        super().open()
+        self._pooled = PooledConnection(self.connection)
+
+
+atexit.register(close_pools)
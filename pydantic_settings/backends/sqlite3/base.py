@@ -0,0 +1,38 @@
+"""
+SQLite database backend supporting the `init_command` and `transaction_mode` OPTIONS
+of Django 5.1+ on older Django versions. sqlite:// DSNs with pragmas or a transaction
+mode select it automatically when needed.
+"""
+
+from django.db.backends.sqlite3 import base
+
+from pydantic_settings.database import SQLITE_TRANSACTION_MODES
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_connection_params(self):
+        options = self.settings_dict["OPTIONS"]
+        self.init_command = options.get("init_command") or ""
+        self.transaction_mode = options.get("transaction_mode")
+        if self.transaction_mode is not None:
+            self.transaction_mode = self.transaction_mode.upper()
+            if self.transaction_mode not in SQLITE_TRANSACTION_MODES:
+                modes = ", ".join(SQLITE_TRANSACTION_MODES)
+                raise ValueError(f"transaction_mode must be one of {modes}")
+        kwargs = super().get_connection_params()
+        kwargs.pop("init_command", None)
+        kwargs.pop("transaction_mode", None)
+        return kwargs
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for command in self.init_command.split(";"):
+            if command := command.strip():
+                conn.execute(command)
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        if self.transaction_mode is None:
+            super()._start_transaction_under_autocommit()
+        else:
+            self.cursor().execute(f"BEGIN {self.transaction_mode}")
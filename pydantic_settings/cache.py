@@ -1,31 +1,54 @@
 import re
-from typing import Dict
+from hashlib import blake2b
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import parse_qs
 
 from django import VERSION
 from pydantic import AnyUrl
 
 from pydantic_settings.models import CacheModel
+from pydantic_settings.networks import join_host, parse_bool, split_multi_host_url
 
 BUILTIN_DJANGO_BACKEND = "django.core.cache.backends.redis.RedisCache"
 DJANGO_REDIS_BACKEND = (
     "django_redis.cache.RedisCache" if VERSION[0] < 4 else BUILTIN_DJANGO_BACKEND
 )
 
+# Redis Sentinel is supported by the backend shipped in pydantic_settings.backends.redis
+# for the built-in backend, and by django-redis' SentinelClient. Redis Cluster is only
+# supported with the built-in backend.
+REDIS_SENTINEL_BACKEND = (
+    "django_redis.cache.RedisCache"
+    if VERSION[0] < 4
+    else "pydantic_settings.backends.redis.RedisSentinelCache"
+)
+REDIS_CLUSTER_BACKEND = "pydantic_settings.backends.redis.RedisClusterCache"
+REDIS_SENTINEL_SCHEMES = ("redis+sentinel", "rediss+sentinel")
+REDIS_CLUSTER_SCHEMES = ("redis+cluster", "rediss+cluster")
+REDIS_SENTINEL_PORT = 26379
+
+BOUNDED_LOCMEM_BACKEND = "pydantic_settings.backends.locmem.BoundedLocMemCache"
+
 CACHE_ENGINES = {
     "db": "django.core.cache.backends.db.DatabaseCache",
     "djangopylibmc": "django_pylibmc.memcached.PyLibMCCache",
     "dummy": "django.core.cache.backends.dummy.DummyCache",
     "elasticache": "django_elasticache.memcached.ElastiCache",
     "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "file+sharded": "pydantic_settings.backends.filebased.ShardedFileBasedCache",
     "hiredis": DJANGO_REDIS_BACKEND,
     "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "locmem+bounded": BOUNDED_LOCMEM_BACKEND,
     "memcached": "django.core.cache.backends.memcached.PyLibMCCache",
     "pymemcache": "django.core.cache.backends.memcached.PyMemcacheCache",
     "pymemcached": "django.core.cache.backends.memcached.MemcachedCache",
     "redis-cache": "redis_cache.RedisCache",
     "redis": DJANGO_REDIS_BACKEND,
     "rediss": DJANGO_REDIS_BACKEND,
+    "redis+sentinel": REDIS_SENTINEL_BACKEND,
+    "rediss+sentinel": REDIS_SENTINEL_BACKEND,
+    "redis+cluster": REDIS_CLUSTER_BACKEND,
+    "rediss+cluster": REDIS_CLUSTER_BACKEND,
     "uwsgicache": "uwsgicache.UWSGICache",
 }
 
@@ -33,6 +56,61 @@ REDIS_PARSERS = {
     "hiredis": "redis.connection.HiredisParser",
 }
 
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+_size = re.compile(r"(\d+)\s*(?:([KMG])I?)?B?", re.IGNORECASE).fullmatch
+
+# memcached's maximum key length, in bytes.
+MEMCACHED_MAX_KEY_LENGTH = 250
+
+
+# Keys of printable ASCII characters, except space.
+_valid_key = re.compile(r"[\x21-\x7e]*").fullmatch
+
+
+class HashedKey:
+    """
+    A cache KEY_FUNCTION producing keys that are valid for memcached: keys built by
+    Django's default key function (`<prefix>:<version>:<key>`) are used as they are
+    if they are at most `max_length` ASCII characters without whitespace or control
+    characters, and are otherwise replaced by a blake2b hash of the key.
+
+    Short keys also keep the key validation that Django runs on every cache call
+    cheap.
+    """
+
+    __slots__ = ("max_length",)
+
+    def __init__(self, max_length: int = MEMCACHED_MAX_KEY_LENGTH):
+        # Leave room for the prefix, version and hash of hashed keys.
+        if not 48 <= max_length <= MEMCACHED_MAX_KEY_LENGTH:
+            raise ValueError(
+                f"max_key_len must be between 48 and {MEMCACHED_MAX_KEY_LENGTH}"
+            )
+        self.max_length = max_length
+
+    def __call__(self, key: str, key_prefix: str, version: Any) -> str:
+        full_key = f"{key_prefix}:{version}:{key}"
+        if len(full_key) <= self.max_length and _valid_key(full_key):
+            return full_key
+        digest = blake2b(full_key.encode(), digest_size=16).hexdigest()
+        hashed_key = f"{key_prefix}:{version}:#{digest}"
+        if len(hashed_key) <= self.max_length and _valid_key(hashed_key):
+            return hashed_key
+        # The prefix itself is too long or invalid.
+        return f"#{digest}"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, HashedKey):
+            return self.max_length == other.max_length
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((HashedKey, self.max_length))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(max_length={self.max_length})"
+
+
 FILE_UNIX_PREFIX = (
     "memcached",
     "pymemcached",
@@ -44,10 +122,13 @@ FILE_UNIX_PREFIX = (
 
 
 class CacheDsn(AnyUrl):
-    __slots__ = AnyUrl.__slots__ + ("query_args",)
+    __slots__ = AnyUrl.__slots__ + ("query_args", "hosts")
     host_required = False
 
     query_args: Dict[str, str]
+    # The (host, port) pairs of the DSN, more than one for the sentinels of
+    # redis+sentinel or the seed nodes of redis+cluster DSNs.
+    hosts: Tuple[Tuple[str, Optional[str]], ...]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -57,9 +138,33 @@ class CacheDsn(AnyUrl):
             }
         else:
             self.query_args = {}
+        self.hosts = ((self.host, self.port),) if self.host else ()
 
     allowed_schemes = set(CACHE_ENGINES)
 
+    @classmethod
+    def validate(cls, value, field, config):
+        if value.__class__ == cls:
+            return value
+        # Validate multi-host DSNs with their first host, and keep the original URL
+        # and the list of hosts.
+        url, hosts = (
+            split_multi_host_url(value) if isinstance(value, str) else (value, [])
+        )
+        dsn = super().validate(url, field, config)
+        if hosts:
+            if not dsn.is_redis_cluster_scheme and not dsn.is_redis_sentinel_scheme:
+                raise ValueError(
+                    "multiple hosts are only supported by redis+sentinel and "
+                    "redis+cluster"
+                )
+            dsn = cls(value, **{name: getattr(dsn, name) for name in AnyUrl.__slots__})
+            dsn.hosts = tuple(hosts)
+        # Build the settings up front so that invalid URLs are reported as a
+        # validation error of the field.
+        dsn.to_settings_model()
+        return dsn
+
     def to_settings_model(self) -> CacheModel:
         return CacheModel(**parse(self))
 
@@ -67,6 +172,14 @@ class CacheDsn(AnyUrl):
     def is_redis_scheme(self) -> bool:
         return self.scheme in ("redis", "rediss", "hiredis")
 
+    @property
+    def is_redis_sentinel_scheme(self) -> bool:
+        return self.scheme in REDIS_SENTINEL_SCHEMES
+
+    @property
+    def is_redis_cluster_scheme(self) -> bool:
+        return self.scheme in REDIS_CLUSTER_SCHEMES
+
 
 def parse(dsn: CacheDsn) -> dict:
     """Parses a cache URL."""
@@ -79,9 +192,11 @@ def parse(dsn: CacheDsn) -> dict:
 
     cache_args = dsn.query_args.copy()
 
+    if dsn.is_redis_sentinel_scheme or dsn.is_redis_cluster_scheme:
+        _parse_redis_nodes(dsn, config, options, cache_args)
     # File based
-    if dsn.host is None:
-        path = dsn.path
+    elif dsn.host is None:
+        path = dsn.path or ""
 
         if dsn.scheme in FILE_UNIX_PREFIX:
             path = "unix:" + path
@@ -128,11 +243,105 @@ def parse(dsn: CacheDsn) -> dict:
     # Pop special options from cache_args
     # https://docs.djangoproject.com/en/4.0/topics/cache/#cache-arguments
     for key in ["MAX_ENTRIES", "CULL_FREQUENCY"]:
-        if val := dsn.query_args.pop(key, None):
+        if val := cache_args.pop(key, None):
             options[key] = int(val)
 
+    if val := cache_args.pop("MAX_BYTES", None):
+        if backend != BOUNDED_LOCMEM_BACKEND:
+            raise ValueError("max_bytes is only supported by locmem+bounded")
+        options["MAX_BYTES"] = parse_size(val)
+
+    max_key_length = cache_args.pop("MAX_KEY_LEN", None)
+    if cache_args.get("KEY_FUNCTION") == "hashed":
+        del cache_args["KEY_FUNCTION"]
+        config["KEY_FUNCTION"] = HashedKey(
+            int(max_key_length or MEMCACHED_MAX_KEY_LENGTH)
+        )
+    elif max_key_length:
+        raise ValueError("max_key_len requires key_function=hashed")
+
+    timeouts = {
+        name: float(cache_args.pop(key))
+        for key, name in (("CONNECT_TIMEOUT", "connect"), ("READ_TIMEOUT", "read"))
+        if key in cache_args
+    }
+    if timeouts:
+        config["TIMEOUTS"] = timeouts
+
     config.update(cache_args)
     if options:
         config["OPTIONS"] = options
 
     return config
+
+
+def parse_size(value: str) -> int:
+    """
+    Parses a size in bytes, optionally with a K, M or G suffix (powers of 1024), e.g.
+    "64MB" or "512k".
+    """
+    match = _size(value.strip())
+    if not match:
+        raise ValueError(f"invalid size {value!r}")
+    number, unit = match.groups()
+    return int(number) * SIZE_UNITS[(unit or "").upper()]
+
+
+def _parse_redis_nodes(
+    dsn: CacheDsn, config: Dict[str, Any], options: Dict[str, Any], cache_args: dict
+) -> None:
+    """
+    Parses redis+sentinel://[:password@]sentinel[:port],.../service_name[/db] and
+    redis+cluster://[:password@]node[:port],... URLs.
+    """
+    ssl = dsn.scheme.startswith("rediss")
+    read_from_replicas = cache_args.pop("READ_FROM_REPLICAS", None)
+    sentinel_kwargs: Dict[str, Any] = {}
+
+    if dsn.is_redis_sentinel_scheme:
+        default_port = REDIS_SENTINEL_PORT
+        service_name, _, db = (dsn.path or "").strip("/").partition("/")
+        if not service_name:
+            raise ValueError("redis+sentinel requires the service name as the path")
+        if val := cache_args.pop("SENTINEL_PASSWORD", None):
+            sentinel_kwargs["password"] = val
+        if ssl:
+            sentinel_kwargs["ssl"] = True
+    else:
+        if VERSION[0] < 4:
+            raise ValueError("redis+cluster requires Django 4.0 or later")
+        default_port = 6379
+        db = (dsn.path or "").strip("/")
+        if db not in ("", "0"):
+            raise ValueError("redis+cluster only supports database 0")
+    db = db or "0"
+    if not db.isdigit():
+        raise ValueError(f"invalid redis database {db!r}")
+    nodes = [(host, int(port or default_port)) for host, port in dsn.hosts]
+    if not nodes:
+        raise ValueError(f"{dsn.scheme} requires at least one host")
+
+    if config["BACKEND"] == "django_redis.cache.RedisCache":
+        # django-redis connects to the service through its sentinels.
+        password = f":{dsn.password}@" if dsn.password else ""
+        scheme = "rediss" if ssl else "redis"
+        config["LOCATION"] = f"{scheme}://{password}{service_name}/{db}"
+        options["CLIENT_CLASS"] = "django_redis.client.SentinelClient"
+        options["CONNECTION_FACTORY"] = "django_redis.pool.SentinelConnectionFactory"
+        options["SENTINELS"] = nodes
+        if sentinel_kwargs:
+            options["SENTINEL_KWARGS"] = sentinel_kwargs
+        return
+
+    config["LOCATION"] = ",".join(join_host(host, str(port)) for host, port in nodes)
+    if dsn.password:
+        options["password"] = dsn.password
+    if ssl:
+        options["ssl"] = True
+    if read_from_replicas:
+        options["read_from_replicas"] = parse_bool(read_from_replicas)
+    if dsn.is_redis_sentinel_scheme:
+        options["service_name"] = service_name
+        options["db"] = int(db)
+        if sentinel_kwargs:
+            options["sentinel_kwargs"] = sentinel_kwargs
@@ -0,0 +1,107 @@
+"""
+Per-path caching policies for the site cache.
+
+Django's cache middleware caches every page with the same CACHE_MIDDLEWARE_SECONDS,
+CACHE_MIDDLEWARE_ALIAS and CACHE_MIDDLEWARE_KEY_PREFIX. `CachePolicyMiddleware`
+instead applies the first policy of the CACHE_MIDDLEWARE_POLICIES setting whose
+`path` matches the path of a request, caching its response for the `seconds` of the
+policy in the cache `alias`, and varying it on the request headers in `vary`.
+Requests matching no policy, or a policy with `seconds` set to 0, aren't cached.
+
+The path prefixes of consecutive policies are compiled into a single regular
+expression when the middleware is created, so matching a request against them takes
+one `re.match()` call. Regular expression policies are compiled separately.
+"""
+
+import re
+from typing import Callable, List, Optional, Pattern, Sequence, Tuple
+
+from django.conf import settings
+from django.middleware.cache import CacheMiddleware
+from django.utils.cache import patch_vary_headers
+
+from pydantic_settings.models import CachePolicyModel
+
+
+def compile_policies(
+    policies: Sequence[CachePolicyModel],
+) -> Callable[[str], Optional[int]]:
+    """
+    Return a function returning the index of the first policy matching a path, or
+    None if none of them do.
+    """
+    # Consecutive path prefixes are compiled into a single regular expression, as
+    # the named groups of an alternation tried in order. Regular expression
+    # policies are compiled on their own, as their groups and backreferences could
+    # clash with those of other policies.
+    matchers: List[Tuple[Pattern, Optional[int]]] = []
+    prefixes: List[str] = []
+
+    def add_prefixes() -> None:
+        if prefixes:
+            matchers.append((re.compile("|".join(prefixes)), None))
+            prefixes.clear()
+
+    for index, policy in enumerate(policies):
+        if policy.path.startswith("^"):
+            add_prefixes()
+            matchers.append((re.compile(policy.path), index))
+        else:
+            prefixes.append(f"(?P<_policy{index}>{re.escape(policy.path)})")
+    add_prefixes()
+
+    def match(path: str) -> Optional[int]:
+        for regex, index in matchers:
+            found = regex.match(path)
+            if found is None:
+                continue
+            if index is None:
+                return int(found.lastgroup[len("_policy") :])
+            return index
+        return None
+
+    return match
+
+
+class CachePolicyMiddleware:
+    """
+    Cache responses according to the CACHE_MIDDLEWARE_POLICIES setting. Use it in
+    place of Django's UpdateCacheMiddleware and FetchFromCacheMiddleware, in the
+    position of FetchFromCacheMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        policies: List[CachePolicyModel] = [
+            CachePolicyModel.parse_obj(policy)
+            for policy in getattr(settings, "CACHE_MIDDLEWARE_POLICIES", [])
+        ]
+        self.match = compile_policies(policies)
+        self.handlers = [self._handler(policy) for policy in policies]
+
+    def _handler(self, policy: CachePolicyModel) -> Callable:
+        if not policy.seconds:
+            return self.get_response
+
+        get_response = self.get_response
+        if policy.vary:
+            # Vary the response before the cache middleware stores it, so that it is
+            # cached per value of the headers.
+            def get_response(request, get_response=get_response, vary=policy.vary):
+                response = get_response(request)
+                patch_vary_headers(response, vary)
+                return response
+
+        return CacheMiddleware(
+            get_response,
+            cache_timeout=policy.seconds,
+            page_timeout=policy.seconds,
+            cache_alias=policy.alias,
+            key_prefix=policy.key_prefix,
+        )
+
+    def __call__(self, request):
+        index = self.match(request.path_info)
+        if index is None:
+            return self.get_response(request)
+        return self.handlers[index](request)
@@ -0,0 +1,177 @@
+"""
+System checks for settings that are known to be slow in production.
+
+They are registered with the `performance` tag as deployment checks when
+`pydantic_settings` is in INSTALLED_APPS, so they run with `manage.py check --deploy`.
+"""
+
+import os
+
+from django import VERSION
+from django.conf import settings
+from django.core.checks import Warning, register
+
+PERFORMANCE = "performance"
+
+LOCAL_DATABASE_ENGINES = (
+    "django.db.backends.sqlite3",
+    "django.contrib.gis.db.backends.spatialite",
+    "pydantic_settings.backends.sqlite3",
+)
+DUMMY_CACHE = "django.core.cache.backends.dummy.DummyCache"
+LOCMEM_CACHE = "django.core.cache.backends.locmem.LocMemCache"
+BOUNDED_LOCMEM_CACHE = "pydantic_settings.backends.locmem.BoundedLocMemCache"
+FILE_CACHE = "django.core.cache.backends.filebased.FileBasedCache"
+FAST_CACHES = ("redis", "memcached", "pylibmc", "elasticache")
+DB_SESSION_ENGINE = "django.contrib.sessions.backends.db"
+DJANGO_TEMPLATES_BACKEND = "django.template.backends.django.DjangoTemplates"
+CACHED_LOADER = "django.template.loaders.cached.Loader"
+
+W001 = "pydantic_settings.W001"
+W002 = "pydantic_settings.W002"
+W003 = "pydantic_settings.W003"
+W004 = "pydantic_settings.W004"
+W005 = "pydantic_settings.W005"
+W006 = "pydantic_settings.W006"
+W007 = "pydantic_settings.W007"
+
+
+def _worker_count() -> int:
+    """
+    The number of server processes, as advertised by the WEB_CONCURRENCY
+    environment variable (used by gunicorn, uvicorn and most PaaS providers).
+    """
+    try:
+        return int(os.environ.get("WEB_CONCURRENCY", "1"))
+    except ValueError:
+        return 1
+
+
+@register(PERFORMANCE, deploy=True)
+def check_persistent_connections(app_configs, **kwargs):
+    errors = []
+    for alias, database in settings.DATABASES.items():
+        if (
+            database.get("ENGINE") in LOCAL_DATABASE_ENGINES
+            or not database.get("HOST")
+            or database["HOST"].startswith("/")
+            or "pool" in (database.get("OPTIONS") or {})
+        ):
+            continue
+        if database.get("CONN_MAX_AGE", 0) == 0:
+            errors.append(
+                Warning(
+                    f"Database {alias!r} opens a new connection for every request.",
+                    hint="Set CONN_MAX_AGE (e.g. ?conn_max_age=60 in the DSN) or use "
+                    "a connection pool.",
+                    id=W001,
+                )
+            )
+    return errors
+
+
+@register(PERFORMANCE, deploy=True)
+def check_default_cache(app_configs, **kwargs):
+    default = settings.CACHES.get("default", {})
+    backend = default.get("BACKEND")
+    if backend == DUMMY_CACHE or (
+        backend in (LOCMEM_CACHE, BOUNDED_LOCMEM_CACHE) and _worker_count() > 1
+    ):
+        return [
+            Warning(
+                f"The default cache uses {backend}, which isn't shared between "
+                "server processes.",
+                hint="Use a shared cache such as redis or memcached.",
+                id=W002,
+            )
+        ]
+    return []
+
+
+@register(PERFORMANCE, deploy=True)
+def check_file_cache_culling(app_configs, **kwargs):
+    return [
+        Warning(
+            f"File based cache {alias!r} doesn't limit its number of entries.",
+            hint="Set MAX_ENTRIES (e.g. ?max_entries=10000 in the DSN) so that the "
+            "cache is culled.",
+            id=W003,
+        )
+        for alias, cache in settings.CACHES.items()
+        if cache.get("BACKEND") == FILE_CACHE
+        and "MAX_ENTRIES" not in (cache.get("OPTIONS") or {})
+    ]
+
+
+@register(PERFORMANCE, deploy=True)
+def check_session_engine(app_configs, **kwargs):
+    fast_caches = [
+        alias
+        for alias, cache in settings.CACHES.items()
+        if any(name in cache.get("BACKEND", "").lower() for name in FAST_CACHES)
+    ]
+    if settings.SESSION_ENGINE == DB_SESSION_ENGINE and fast_caches:
+        return [
+            Warning(
+                "Sessions are stored in the database although a fast cache is "
+                "configured.",
+                hint="Use the cache or cached_db session engine with "
+                f"SESSION_CACHE_ALIAS set to {fast_caches[0]!r}.",
+                id=W004,
+            )
+        ]
+    return []
+
+
+@register(PERFORMANCE, deploy=True)
+def check_debug(app_configs, **kwargs):
+    if settings.DEBUG:
+        return [
+            Warning(
+                "DEBUG is on, which records every SQL query and disables template "
+                "caching.",
+                id=W005,
+            )
+        ]
+    return []
+
+
+@register(PERFORMANCE, deploy=True)
+def check_template_loaders(app_configs, **kwargs):
+    errors = []
+    for template in settings.TEMPLATES:
+        if template.get("BACKEND") != DJANGO_TEMPLATES_BACKEND:
+            continue
+        loaders = (template.get("OPTIONS") or {}).get("loaders")
+        if loaders is None:
+            # Django 4.1+ caches templates by default, older versions only when DEBUG
+            # is off.
+            cached = VERSION >= (4, 1) or not settings.DEBUG
+        else:
+            cached = any(
+                (loader[0] if isinstance(loader, (list, tuple)) else loader)
+                == CACHED_LOADER
+                for loader in loaders
+            )
+        if not cached:
+            errors.append(
+                Warning(
+                    f"Template backend {template.get('NAME') or template['BACKEND']!r} "
+                    "doesn't cache compiled templates.",
+                    hint=f"Wrap the template loaders in {CACHED_LOADER}.",
+                    id=W006,
+                )
+            )
+    return errors
+
+
+@register(PERFORMANCE, deploy=True)
+def check_session_save_every_request(app_configs, **kwargs):
+    if settings.SESSION_SAVE_EVERY_REQUEST:
+        return [
+            Warning(
+                "SESSION_SAVE_EVERY_REQUEST writes the session on every request.",
+                id=W007,
+            )
+        ]
+    return []
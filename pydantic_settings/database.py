@@ -1,12 +1,14 @@
 import re
 import urllib.parse
-from typing import Dict, Optional, Pattern, Tuple, cast
-from urllib.parse import quote_plus
+from typing import Any, Dict, Optional, Pattern, Tuple, cast
+from urllib.parse import parse_qsl, quote_plus
 
+from django import VERSION
 from pydantic import AnyUrl
 from pydantic.validators import constr_length_validator, str_validator
 
 from pydantic_settings.models import DatabaseModel
+from pydantic_settings.networks import parse_bool, split_multi_host_url
 
 _cloud_sql_regex_cache = None
 
@@ -25,6 +27,59 @@ DB_ENGINES = {
     "redshift": "django_redshift_backend",
 }
 
+# Connection poolers that can be selected with a `<scheme>+<pooler>` DSN scheme, e.g.
+# `postgres+pgbouncer://` or `postgres+pool://`.
+DB_POOLERS = ("pgbouncer", "pool")
+POSTGRES_SCHEMES = ("postgres", "postgresql", "postgis")
+
+DB_SCHEMES = set(DB_ENGINES) | {
+    f"{scheme}+{pooler}" for scheme in POSTGRES_SCHEMES for pooler in DB_POOLERS
+}
+
+# Query arguments of `+pool` DSNs that are passed to psycopg's ConnectionPool.
+POOL_ARGS = {
+    "min_size": int,
+    "max_size": int,
+    "max_waiting": int,
+    "num_workers": int,
+    "timeout": float,
+    "max_lifetime": float,
+    "max_idle": float,
+    "reconnect_timeout": float,
+}
+
+# Query arguments setting the TIMEOUTS of the database, in seconds.
+TIMEOUT_ARGS = {
+    "connect_timeout": "connect",
+    "statement_timeout": "statement",
+    "lock_timeout": "lock",
+    "idle_in_transaction_timeout": "idle_in_transaction",
+}
+
+# Valid values of libpq's multi-host connection parameters.
+TARGET_SESSION_ATTRS = (
+    "any",
+    "read-write",
+    "read-only",
+    "primary",
+    "standby",
+    "prefer-standby",
+)
+LOAD_BALANCE_HOSTS = ("disable", "random")
+
+# Pragmas that can be set with query arguments of sqlite:// DSNs, with their valid
+# values or type. They are applied with the init_command option.
+SQLITE_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"),
+    "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA"),
+    "mmap_size": int,
+    "cache_size": int,
+}
+SQLITE_TRANSACTION_MODES = ("DEFERRED", "IMMEDIATE", "EXCLUSIVE")
+# Django supports the init_command and transaction_mode options since 5.1; older
+# versions use the backend shipped in pydantic_settings.backends.sqlite3.
+SQLITE_COMPAT_ENGINE = "pydantic_settings.backends.sqlite3"
+
 
 def cloud_sql_regex() -> Pattern[str]:
     global _cloud_sql_regex_cache
@@ -39,7 +94,17 @@ def cloud_sql_regex() -> Pattern[str]:
 
 
 class DatabaseDsn(AnyUrl):
-    allowed_schemes = set(DB_ENGINES)
+    __slots__ = AnyUrl.__slots__ + ("query_args", "hosts")
+    allowed_schemes = DB_SCHEMES
+
+    query_args: Dict[str, str]
+    # The (host, port) pairs of the DSN, more than one for multi-host DSNs.
+    hosts: Tuple[Tuple[str, Optional[str]], ...]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.query_args = dict(parse_qsl(self.query)) if self.query else {}
+        self.hosts = ((self.host, self.port),) if self.host else ()
 
     @classmethod
     def validate(cls, value, field, config):
@@ -58,10 +123,23 @@ class DatabaseDsn(AnyUrl):
                 parts = m.groupdict()
                 socket, path = parts["path"].rsplit("/", 1)
                 escaped_socket = quote_plus(socket)
-                escaped_dsn = value.replace(socket, escaped_socket)
-                return super().validate(escaped_dsn, field, config)
+                url = value.replace(socket, escaped_socket)
 
-        return super().validate(value, field, config)
+        # Validate multi-host DSNs with their first host, and keep the original URL
+        # and the list of hosts.
+        single_host_url, hosts = split_multi_host_url(url)
+        if hosts:
+            dsn = cast(DatabaseDsn, super().validate(single_host_url, field, config))
+            if dsn.engine_scheme not in POSTGRES_SCHEMES:
+                raise ValueError("multiple hosts are only supported by PostgreSQL")
+            dsn = cls(url, **{name: getattr(dsn, name) for name in AnyUrl.__slots__})
+            dsn.hosts = tuple(hosts)
+        else:
+            dsn = cast(DatabaseDsn, super().validate(url, field, config))
+        # Build the settings up front so that invalid query arguments are reported
+        # as a validation error of the field.
+        dsn.to_settings_model()
+        return dsn
 
     @classmethod
     def validate_host(
@@ -81,15 +159,168 @@ class DatabaseDsn(AnyUrl):
 
         return super().validate_host(parts)
 
+    @property
+    def engine_scheme(self) -> str:
+        return self.scheme.split("+", 1)[0]
+
+    @property
+    def pooler(self) -> Optional[str]:
+        _, _, pooler = self.scheme.partition("+")
+        return pooler or None
+
     def to_settings_model(self) -> DatabaseModel:
-        name = self.path
-        if name and name.startswith("/"):
-            name = name[1:]
-        return DatabaseModel(
-            NAME=name or "",
-            USER=self.user or "",
-            PASSWORD=self.password or "",
-            HOST=urllib.parse.unquote(self.host) if self.host else "",
-            PORT=self.port or "",
-            ENGINE=DB_ENGINES[self.scheme],
-        )
+        return DatabaseModel(**parse(self))
+
+
+def parse(dsn: DatabaseDsn) -> Dict[str, Any]:
+    """Parses a database URL."""
+    name = dsn.path
+    if name and name.startswith("/"):
+        name = name[1:]
+    config: Dict[str, Any] = {
+        "NAME": name or "",
+        "USER": dsn.user or "",
+        "PASSWORD": dsn.password or "",
+        "HOST": urllib.parse.unquote(dsn.host) if dsn.host else "",
+        "PORT": dsn.port or "",
+        "ENGINE": DB_ENGINES[dsn.engine_scheme],
+    }
+
+    options: Dict[str, Any] = {}
+    query_args = dsn.query_args.copy()
+
+    if len(dsn.hosts) > 1:
+        # libpq takes comma separated host and port lists, with an empty port for
+        # the default port.
+        config["HOST"] = ",".join(host for host, _ in dsn.hosts)
+        if any(port for _, port in dsn.hosts):
+            config["PORT"] = ",".join(port or "" for _, port in dsn.hosts)
+
+    if dsn.engine_scheme in POSTGRES_SCHEMES:
+        for key, choices in (
+            ("target_session_attrs", TARGET_SESSION_ATTRS),
+            ("load_balance_hosts", LOAD_BALANCE_HOSTS),
+        ):
+            if key in query_args and query_args[key] not in choices:
+                raise ValueError(
+                    f"invalid {key} {query_args[key]!r}, expected one of "
+                    + ", ".join(choices)
+                )
+
+    if dsn.engine_scheme in ("sqlite", "spatialite"):
+        _parse_sqlite_options(dsn, config, options, query_args)
+
+    if val := query_args.pop("conn_max_age", None):
+        config["CONN_MAX_AGE"] = int(val)
+    if val := query_args.pop("conn_health_checks", None):
+        config["CONN_HEALTH_CHECKS"] = parse_bool(val)
+    if val := query_args.pop("disable_server_side_cursors", None):
+        config["DISABLE_SERVER_SIDE_CURSORS"] = parse_bool(val)
+
+    timeouts = {
+        name: float(query_args.pop(key))
+        for key, name in TIMEOUT_ARGS.items()
+        if key in query_args
+    }
+    if timeouts:
+        config["TIMEOUTS"] = timeouts
+
+    if dsn.pooler == "pgbouncer":
+        # PgBouncer in transaction pooling mode doesn't support server-side cursors.
+        # https://docs.djangoproject.com/en/stable/ref/databases/#transaction-pooling-and-server-side-cursors
+        if config.get("DISABLE_SERVER_SIDE_CURSORS") is False:
+            raise ValueError("pgbouncer requires server-side cursors to be disabled")
+        config["DISABLE_SERVER_SIDE_CURSORS"] = True
+        # PgBouncer rejects the `-c` startup options that set the session timeouts.
+        if set(timeouts) - {"connect"}:
+            raise ValueError(
+                "pgbouncer doesn't support statement, lock or idle in transaction "
+                "timeouts, set them on the database role instead"
+            )
+    elif dsn.pooler == "pool":
+        # Django's native connection pool (Django 5.1+, psycopg 3) manages connection
+        # lifetimes itself and refuses persistent connections.
+        if config.get("CONN_MAX_AGE"):
+            raise ValueError(
+                "connection pooling doesn't support persistent connections"
+            )
+        pool_options = {
+            key: POOL_ARGS[key](query_args.pop(key))
+            for key in list(query_args)
+            if key in POOL_ARGS
+        }
+        min_size = pool_options.get("min_size")
+        max_size = pool_options.get("max_size")
+        if min_size is not None and max_size is not None and min_size > max_size:
+            raise ValueError("pool min_size must not be greater than max_size")
+        options["pool"] = pool_options or True
+
+    if dsn.engine_scheme in ("sqlite", "spatialite"):
+        # sqlite3.connect() rejects unknown arguments, so any other query arguments
+        # are ignored rather than failing at connect time.
+        query_args.clear()
+    # Anything else is passed on to the database driver.
+    options.update(query_args)
+    if options:
+        config["OPTIONS"] = options
+
+    return config
+
+
+def _parse_sqlite_options(
+    dsn: DatabaseDsn,
+    config: Dict[str, Any],
+    options: Dict[str, Any],
+    query_args: Dict[str, str],
+) -> None:
+    """
+    Translate pragma, busy_timeout and transaction_mode query arguments into the
+    init_command, timeout and transaction_mode OPTIONS.
+    """
+    commands = []
+    for pragma, kind in SQLITE_PRAGMAS.items():
+        val = query_args.pop(pragma, None)
+        if val is None:
+            continue
+        if isinstance(kind, tuple):
+            val = val.upper()
+            if val not in kind:
+                raise ValueError(f"{pragma} must be one of {', '.join(kind)}")
+        else:
+            val = str(kind(val))
+            if pragma == "mmap_size" and int(val) < 0:
+                raise ValueError("mmap_size must not be negative")
+        commands.append(f"PRAGMA {pragma}={val}")
+    if val := query_args.pop("init_command", None):
+        commands.append(val)
+    if commands:
+        options["init_command"] = ";".join(commands)
+
+    busy_timeout = query_args.pop("busy_timeout", None)
+    timeout = query_args.pop("timeout", None)
+    if busy_timeout is not None and timeout is not None:
+        raise ValueError("busy_timeout and timeout are mutually exclusive")
+    if busy_timeout is not None:
+        # busy_timeout is in milliseconds, like the pragma, sqlite3's timeout in
+        # seconds.
+        timeout = str(int(busy_timeout) / 1000)
+    if timeout is not None:
+        options["timeout"] = float(timeout)
+        if options["timeout"] < 0:
+            raise ValueError("timeout must not be negative")
+
+    if val := query_args.pop("transaction_mode", None):
+        val = val.upper()
+        if val not in SQLITE_TRANSACTION_MODES:
+            modes = ", ".join(SQLITE_TRANSACTION_MODES)
+            raise ValueError(f"transaction_mode must be one of {modes}")
+        options["transaction_mode"] = val
+
+    if VERSION < (5, 1) and (
+        "init_command" in options or "transaction_mode" in options
+    ):
+        if dsn.engine_scheme != "sqlite":
+            raise ValueError(
+                "pragmas and transaction_mode require Django 5.1 with spatialite"
+            )
+        config["ENGINE"] = SQLITE_COMPAT_ENGINE
@@ -1,7 +1,14 @@
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
+from django import VERSION
+from django.conf import global_settings
 from pydantic import root_validator
 
+from pydantic_settings.checks import (
+    CACHED_LOADER,
+    DJANGO_TEMPLATES_BACKEND,
+    DUMMY_CACHE,
+)
 from pydantic_settings.models import DatabaseModel, TemplateBackendModel
 from pydantic_settings.settings import DatabaseModel, PydanticSettings
 
@@ -82,3 +89,100 @@ class DjangoDefaultProjectSettings(PydanticSettings):
                 ENGINE="django.db.backends.sqlite3", NAME=str(base_dir / "db.sqlite3")
             )
         return values
+
+
+MANIFEST_STATIC_STORAGE = (
+    "django.contrib.staticfiles.storage.ManifestStaticFilesStorage"
+)
+
+
+class ProductionSettings(PydanticSettings):
+    """
+    A PydanticSettings subclass with performance-oriented defaults for production
+    deployments. Every default can still be overridden from the environment.
+
+    - Django templates use the cached template loader unless DEBUG is on or the
+      loaders are configured explicitly.
+    - Databases use persistent connections (`DJANGO_CONN_MAX_AGE`, 60 seconds by
+      default) with health checks (`DJANGO_CONN_HEALTH_CHECKS`), unless their
+      CONN_MAX_AGE is set explicitly or they use a connection pool.
+    - Sessions use the `cached_db` engine when the default cache isn't a dummy cache.
+    - Static files use the manifest storage, so they can be cached indefinitely.
+    """
+
+    DEBUG: bool = False
+    DEBUG_PROPAGATE_EXCEPTIONS: bool = False
+
+    SESSION_ENGINE: Optional[str] = None
+
+    if VERSION >= (4, 2):
+        STORAGES: Dict[str, Dict[str, Any]] = {
+            **global_settings.STORAGES,
+            "staticfiles": {"BACKEND": MANIFEST_STATIC_STORAGE},
+        }
+    else:
+        STATICFILES_STORAGE: str = MANIFEST_STATIC_STORAGE
+
+    conn_max_age: int = 60
+    conn_health_checks: bool = True
+
+    @root_validator(allow_reuse=True)
+    def cache_templates(cls, values):
+        """
+        Use the cached template loader for Django template backends without explicitly
+        configured loaders when DEBUG is off.
+        """
+        if values.get("DEBUG") or not values.get("TEMPLATES"):
+            return values
+
+        templates = []
+        for template in values["TEMPLATES"]:
+            template = TemplateBackendModel.parse_obj(template)
+            options = template.OPTIONS or {}
+            if (
+                template.BACKEND == DJANGO_TEMPLATES_BACKEND
+                and "loaders" not in options
+            ):
+                loaders = ["django.template.loaders.filesystem.Loader"]
+                if template.APP_DIRS:
+                    loaders.append("django.template.loaders.app_directories.Loader")
+                template = template.copy(
+                    update={
+                        "APP_DIRS": False,
+                        "OPTIONS": {**options, "loaders": [(CACHED_LOADER, loaders)]},
+                    }
+                )
+            templates.append(template)
+        values["TEMPLATES"] = templates
+        return values
+
+    @root_validator(skip_on_failure=True, allow_reuse=True)
+    def persist_connections(cls, values):
+        """
+        Enable persistent connections with health checks for databases that don't set
+        CONN_MAX_AGE themselves.
+        """
+        databases = values.get("DATABASES") or {}
+        for alias, database in databases.items():
+            if "CONN_MAX_AGE" in database.__fields_set__ or "pool" in database.OPTIONS:
+                continue
+            databases[alias] = database.copy(
+                update={
+                    "CONN_MAX_AGE": values["conn_max_age"],
+                    "CONN_HEALTH_CHECKS": values["conn_health_checks"],
+                }
+            )
+        return values
+
+    @root_validator(allow_reuse=True)
+    def default_session_engine(cls, values):
+        """
+        Store sessions with the cached_db engine when there is a real default cache.
+        """
+        if not values.get("SESSION_ENGINE"):
+            default_cache = (values.get("CACHES") or {}).get("default")
+            if default_cache and default_cache.BACKEND != DUMMY_CACHE:
+                values["SESSION_ENGINE"] = "django.contrib.sessions.backends.cached_db"
+            else:
+                values["SESSION_ENGINE"] = global_settings.SESSION_ENGINE
+        return values
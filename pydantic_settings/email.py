@@ -0,0 +1,98 @@
+from typing import Any, Dict
+from urllib.parse import parse_qsl, unquote
+
+from pydantic import AnyUrl
+
+from pydantic_settings.models import EmailModel
+from pydantic_settings.networks import parse_bool
+
+SMTP_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+POOLED_SMTP_BACKEND = "pydantic_settings.backends.smtp.PooledEmailBackend"
+
+EMAIL_BACKENDS = {
+    "console": "django.core.mail.backends.console.EmailBackend",
+    "dummy": "django.core.mail.backends.dummy.EmailBackend",
+    "file": "django.core.mail.backends.filebased.EmailBackend",
+    "locmem": "django.core.mail.backends.locmem.EmailBackend",
+    "smtp": SMTP_BACKEND,
+    "smtps": SMTP_BACKEND,
+    "submission": SMTP_BACKEND,
+}
+
+# Default ports of the SMTP schemes; smtps uses implicit TLS (EMAIL_USE_SSL) and
+# submission uses STARTTLS (EMAIL_USE_TLS).
+SMTP_PORTS = {"smtp": 25, "smtps": 465, "submission": 587}
+
+EMAIL_SCHEMES = set(EMAIL_BACKENDS) | {f"{scheme}+pool" for scheme in SMTP_PORTS}
+
+# Query arguments of `+pool` DSNs, setting the EMAIL_POOL_* settings.
+POOL_ARGS = {
+    "pool_size": ("EMAIL_POOL_SIZE", int),
+    "idle_timeout": ("EMAIL_POOL_IDLE_TIMEOUT", float),
+    "max_messages": ("EMAIL_POOL_MAX_MESSAGES", int),
+}
+
+
+class EmailDsn(AnyUrl):
+    __slots__ = AnyUrl.__slots__ + ("query_args",)
+    allowed_schemes = EMAIL_SCHEMES
+    host_required = False
+
+    query_args: Dict[str, str]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.query_args = dict(parse_qsl(self.query)) if self.query else {}
+
+    @classmethod
+    def validate(cls, value, field, config):
+        dsn = super().validate(value, field, config)
+        # Parse the DSN up front so that invalid query arguments are reported as a
+        # validation error of the field.
+        parse(dsn)
+        return dsn
+
+    def to_settings_model(self) -> EmailModel:
+        return EmailModel(**parse(self))
+
+
+def parse(dsn: EmailDsn) -> Dict[str, Any]:
+    """Parses an email URL."""
+    scheme, _, pool = dsn.scheme.partition("+")
+    query_args = dsn.query_args.copy()
+    config: Dict[str, Any] = {
+        "EMAIL_BACKEND": POOLED_SMTP_BACKEND if pool else EMAIL_BACKENDS[scheme]
+    }
+
+    if scheme == "file":
+        config["EMAIL_FILE_PATH"] = dsn.path
+
+    if scheme in SMTP_PORTS:
+        if dsn.host:
+            config["EMAIL_HOST"] = dsn.host
+        config["EMAIL_PORT"] = int(dsn.port or SMTP_PORTS[scheme])
+        config["EMAIL_HOST_USER"] = unquote(dsn.user or "")
+        config["EMAIL_HOST_PASSWORD"] = unquote(dsn.password or "")
+        config["EMAIL_USE_SSL"] = scheme == "smtps"
+        config["EMAIL_USE_TLS"] = scheme == "submission"
+        if val := query_args.pop("ssl", None):
+            config["EMAIL_USE_SSL"] = parse_bool(val)
+        if val := query_args.pop("tls", None):
+            config["EMAIL_USE_TLS"] = parse_bool(val)
+        if config["EMAIL_USE_SSL"] and config["EMAIL_USE_TLS"]:
+            raise ValueError("ssl and tls are mutually exclusive")
+        if val := query_args.pop("timeout", None):
+            config["EMAIL_TIMEOUT"] = int(val)
+        for key in ("ssl_certfile", "ssl_keyfile"):
+            if val := query_args.pop(key, None):
+                config[f"EMAIL_{key.upper()}"] = val
+
+    if pool:
+        for key, (setting, type_) in POOL_ARGS.items():
+            if val := query_args.pop(key, None):
+                config[setting] = type_(val)
+
+    if query_args:
+        raise ValueError(f"unsupported query arguments: {', '.join(query_args)}")
+
+    return config
@@ -0,0 +1,190 @@
+"""
+Opt-in instrumentation of Django settings reads.
+
+`enable()` replaces the class of `django.conf.settings` with a subclass that counts
+every read of an (uppercase) setting, in total and per request or task. Disabling it
+restores the original class, so there is no overhead at all when instrumentation is
+off. It is enabled by `SetUp.configure()` when the DJANGO_SETTINGS_INSTRUMENT
+environment variable is set.
+
+`SettingsReadsMiddleware` attributes the reads made while handling a request to the
+URL route of the request, and `track()` does the same for other units of work such
+as background tasks. `snapshot()` returns the counts collected so far.
+"""
+
+import itertools
+import threading
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from django.conf import LazySettings, settings
+from django.utils.functional import empty
+
+UNRESOLVED_ROUTE = "<unresolved>"
+
+# Every thread counts into its own Counter, so that reads don't need a lock. The
+# counts of a thread are folded into _finished_counts when it exits.
+_local = threading.local()
+_thread_counts: Dict[int, "Counter[str]"] = {}
+_finished_counts: "Counter[str]" = Counter()
+_thread_ids = itertools.count()
+_scopes: Dict[str, Dict[str, Any]] = {}
+_lock = threading.Lock()
+_scope_reads: ContextVar[Optional["Counter[str]"]] = ContextVar(
+    "pydantic_settings_scope_reads", default=None
+)
+
+
+class _ThreadReads:
+    """The reads of settings made by a thread, kept in its thread local storage."""
+
+    def __init__(self) -> None:
+        self.counts: "Counter[str]" = Counter()
+        thread_id = next(_thread_ids)
+        with _lock:
+            _thread_counts[thread_id] = self.counts
+        # Thread local storage is released when its thread exits.
+        weakref.finalize(self, _fold_counts, thread_id, self.counts)
+
+
+def _fold_counts(thread_id: int, counts: "Counter[str]") -> None:
+    with _lock:
+        _finished_counts.update(counts)
+        del _thread_counts[thread_id]
+
+
+def _counts() -> "Counter[str]":
+    try:
+        return _local.reads.counts
+    except AttributeError:
+        _local.reads = _ThreadReads()
+        return _local.reads.counts
+
+
+def _copy_counts(counts: "Counter[str]") -> "Counter[str]":
+    # The thread owning the counts may add a setting while they are copied.
+    while True:
+        try:
+            return counts.copy()
+        except RuntimeError:
+            continue
+
+
+class InstrumentedSettings(LazySettings):
+    """A LazySettings that counts the reads of settings."""
+
+    def __getattribute__(self, name: str) -> Any:
+        if name.isupper():
+            _counts()[name] += 1
+            scope_reads = _scope_reads.get()
+            if scope_reads is not None:
+                scope_reads[name] += 1
+        return super().__getattribute__(name)
+
+
+def _set_class(cls: type) -> None:
+    # LazyObject proxies __class__ to the wrapped object, so set the class with the
+    # descriptor of object itself.
+    object.__dict__["__class__"].__set__(settings, cls)
+
+
+def enable() -> None:
+    """Start counting the reads of settings."""
+    _set_class(InstrumentedSettings)
+
+
+def disable() -> None:
+    """Stop counting the reads of settings, keeping the counts collected so far."""
+    _set_class(LazySettings)
+
+
+def is_enabled() -> bool:
+    return type(settings) is InstrumentedSettings
+
+
+def reset() -> None:
+    """Clear the counts."""
+    with _lock:
+        for counts in _thread_counts.values():
+            counts.clear()
+        _finished_counts.clear()
+        _scopes.clear()
+
+
+def _record(name: str, scope_reads: "Counter[str]") -> None:
+    with _lock:
+        scope = _scopes.setdefault(name, {"count": 0, "reads": Counter()})
+        scope["count"] += 1
+        scope["reads"].update(scope_reads)
+
+
+@contextmanager
+def track(name: str) -> Iterator["Counter[str]"]:
+    """
+    Count the settings read within the block separately, under `name` (e.g. the name
+    of a task). The counts of all blocks with the same name are aggregated.
+    """
+    scope_reads: "Counter[str]" = Counter()
+    token = _scope_reads.set(scope_reads)
+    try:
+        yield scope_reads
+    finally:
+        _scope_reads.reset(token)
+        _record(name, scope_reads)
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    Return the number of reads of each setting, the configured settings that haven't
+    been read, and the reads per request route or tracked task::
+
+        {
+            "reads": {"DEBUG": 120, ...},
+            "unread": ["ABSOLUTE_URL_OVERRIDES", ...],
+            "scopes": {"api/items/<int:pk>/": {"count": 10, "reads": {...}}},
+        }
+    """
+    with _lock:
+        reads = _finished_counts.copy()
+        for counts in _thread_counts.values():
+            reads.update(_copy_counts(counts))
+        scopes = {
+            name: {"count": scope["count"], "reads": dict(scope["reads"])}
+            for name, scope in _scopes.items()
+        }
+    wrapped = object.__getattribute__(settings, "_wrapped")
+    configured = (
+        {name for name in dir(wrapped) if name.isupper()}
+        if wrapped is not empty
+        else set()
+    )
+    return {
+        "reads": dict(reads.most_common()),
+        "unread": sorted(configured - set(reads)),
+        "scopes": scopes,
+    }
+
+
+class SettingsReadsMiddleware:
+    """
+    Count the settings read by each request, per URL route. Requests that don't
+    resolve to a route are counted together, as "<unresolved>".
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not is_enabled():
+            return self.get_response(request)
+        scope_reads: "Counter[str]" = Counter()
+        token = _scope_reads.set(scope_reads)
+        try:
+            return self.get_response(request)
+        finally:
+            _scope_reads.reset(token)
+            route = getattr(request.resolver_match, "route", None)
+            _record(route or UNRESOLVED_ROUTE, scope_reads)
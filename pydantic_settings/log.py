@@ -0,0 +1,171 @@
+"""
+Non-blocking logging.
+
+`configure_logging` is a LOGGING_CONFIG function that applies a LOGGING
+configuration with `logging.config.dictConfig()` and then, if the configuration has a
+`queue` section, moves the handlers of every logger behind a queue. Logging
+calls then only put records on the queue, and a `QueueListener` thread passes them on
+to the actual (possibly slow) handlers. The listener threads are restarted in child
+processes after a fork.
+"""
+
+import atexit
+import logging
+import logging.config
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Tuple
+
+from django.utils.log import AdminEmailHandler
+
+# Handlers that must handle records in the thread that logs them.
+SYNCHRONOUS_HANDLERS = (AdminEmailHandler,)
+
+_listeners: List[Tuple[QueueListener, "OverflowQueueHandler"]] = []
+_listeners_lock = threading.Lock()
+
+
+class OverflowQueueHandler(QueueHandler):
+    """
+    A QueueHandler for bounded queues, which counts the records it enqueues and the
+    records it drops when the queue is full.
+    """
+
+    def __init__(self, records: "queue.Queue[Any]", overflow: str = "drop"):
+        super().__init__(records)
+        self.overflow = overflow
+        self.enqueued = 0
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Handler.handle() holds the handler's lock while emitting, so the counters
+        # don't need a lock of their own.
+        if self.overflow == "block":
+            self.queue.put(record)
+        else:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                if self.overflow != "drop_oldest" or not self._drop_oldest(record):
+                    self.dropped += 1
+                    return
+        self.enqueued += 1
+
+    def _drop_oldest(self, record: logging.LogRecord) -> bool:
+        try:
+            self.queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self.dropped += 1
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            return False
+        return True
+
+
+def configure_logging(logging_settings: Dict[str, Any]) -> None:
+    """
+    Configure logging from a LOGGING setting, putting the handlers of every logger
+    behind a queue if it has a `queue` section.
+
+    This includes the loggers configured by Django's DEFAULT_LOGGING before the
+    LOGGING setting is applied, like the "django" logger. Handlers that need the
+    exception info or the request of a record, like mail_admins, are left out of the
+    queue (see SYNCHRONOUS_HANDLERS): a queued record loses its exception info, and
+    is handled after the request has finished, on another thread.
+    """
+    config = dict(logging_settings)
+    queue_options = config.pop("queue", None)
+    # Flush the queues of a previous configuration before its handlers are closed.
+    stop_listeners()
+    logging.config.dictConfig(config)
+    if not queue_options:
+        return
+
+    loggers = [logging.getLogger()] + [
+        logger
+        for logger in list(logging.Logger.manager.loggerDict.values())
+        if isinstance(logger, logging.Logger)
+    ]
+    queue_handlers: Dict[Tuple[int, ...], OverflowQueueHandler] = {}
+    for logger in loggers:
+        if not logger.handlers or any(
+            isinstance(handler, QueueHandler) for handler in logger.handlers
+        ):
+            continue
+        handlers = [
+            handler
+            for handler in logger.handlers
+            if not isinstance(handler, SYNCHRONOUS_HANDLERS)
+        ]
+        synchronous = [
+            handler
+            for handler in logger.handlers
+            if isinstance(handler, SYNCHRONOUS_HANDLERS)
+        ]
+        if not handlers:
+            continue
+        # Loggers sharing the same handlers share a queue.
+        key = tuple(id(handler) for handler in handlers)
+        queue_handler = queue_handlers.get(key)
+        if queue_handler is None:
+            records: "queue.Queue[Any]" = queue.Queue(queue_options.get("maxsize", 0))
+            queue_handler = OverflowQueueHandler(
+                records, queue_options.get("overflow", "drop")
+            )
+            listener = QueueListener(records, *handlers, respect_handler_level=True)
+            listener.start()
+            with _listeners_lock:
+                _listeners.append((listener, queue_handler))
+            queue_handlers[key] = queue_handler
+        logger.handlers = [queue_handler, *synchronous]
+
+
+def _restart_listeners() -> None:
+    # Only the thread that forked runs in a child process: the listener threads of
+    # the parent are gone, and the locks of their queues may be held. Give every
+    # listener a new queue and thread.
+    global _listeners_lock
+
+    _listeners_lock = threading.Lock()
+    for listener, queue_handler in _listeners:
+        records: "queue.Queue[Any]" = queue.Queue(queue_handler.queue.maxsize)
+        listener.queue = queue_handler.queue = records
+        listener._thread = None
+        listener.start()
+
+
+def stop_listeners() -> None:
+    """Stop the queue listeners, after they have handled all queued records."""
+    with _listeners_lock:
+        listeners = _listeners[:]
+        _listeners.clear()
+    for listener, _ in listeners:
+        listener.stop()
+
+
+def queue_stats() -> List[Dict[str, Any]]:
+    """
+    Return the number of records enqueued, dropped and currently waiting in each of the
+    logging queues.
+    """
+    with _listeners_lock:
+        listeners = _listeners[:]
+    return [
+        {
+            "handlers": [handler.get_name() for handler in listener.handlers],
+            "enqueued": queue_handler.enqueued,
+            "dropped": queue_handler.dropped,
+            "queued": listener.queue.qsize(),
+        }
+        for listener, queue_handler in listeners
+    ]
+
+
+atexit.register(stop_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listeners)
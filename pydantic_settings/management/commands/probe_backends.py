@@ -0,0 +1,62 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from pydantic_settings import probe
+
+KINDS = (("databases", "Database"), ("caches", "Cache"), ("email", "Email"))
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the connect and round trip times of the configured databases, "
+        "caches and SMTP server, and suggest settings for them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=10,
+            help="Number of connections to open to each backend (default: 10).",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30.0,
+            help=(
+                "Seconds after which to stop probing, also used as the connect "
+                "timeout of the probes (default: 30)."
+            ),
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Output the measurements and suggestions as JSON.",
+        )
+
+    def handle(self, *args, **options):
+        report = probe.probe(samples=options["samples"], timeout=options["timeout"])
+        suggestions = probe.suggest(report)
+        if options["json"]:
+            self.stdout.write(
+                json.dumps({**report, "suggestions": suggestions}, indent=2)
+            )
+            return
+
+        for kind, label in KINDS:
+            for name, result in report[kind].items():
+                if "error" in result:
+                    self.stdout.write(
+                        self.style.ERROR(f"{label} {name!r}: {result['error']}")
+                    )
+                    continue
+                self.stdout.write(f"{label} {name!r}:")
+                for measure in ("connect", "rtt"):
+                    values = "  ".join(
+                        f"{key} {value * 1000:8.2f}ms"
+                        for key, value in result[measure].items()
+                    )
+                    self.stdout.write(f"  {measure:<8}{values}")
+        for suggestion in suggestions:
+            self.stdout.write(self.style.WARNING(suggestion))
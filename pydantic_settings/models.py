@@ -1,8 +1,11 @@
-from typing import List, Optional
+import re
+from typing import Callable, Dict, List, Optional, Union
 
-from pydantic import DirectoryPath
-from pydantic.main import BaseModel
-from typing_extensions import TypedDict
+from pydantic import DirectoryPath, PositiveFloat, root_validator, validator
+from pydantic.main import BaseModel, Extra
+from typing_extensions import Literal, TypedDict
+
+from pydantic_settings.timeouts import cache_options, database_options
 
 
 class TemplateBackendModel(BaseModel):
@@ -13,15 +16,68 @@ class TemplateBackendModel(BaseModel):
     OPTIONS: Optional[dict]
 
 
+class CacheTimeoutsModel(BaseModel):
+    # Socket timeouts in seconds.
+    connect: Optional[PositiveFloat] = None
+    read: Optional[PositiveFloat] = None
+
+
 class CacheModel(BaseModel):
     BACKEND: str
-    KEY_FUNCTION: Optional[str] = None
+    # The dotted path of a key function, or the function itself.
+    KEY_FUNCTION: Optional[Union[str, Callable]] = None
     KEY_PREFIX: str = ""
     LOCATION: str = ""
     OPTIONS: dict = {}
     TIMEOUT: Optional[int] = None
+    # Not to be confused with TIMEOUT, the default expiry of cache entries.
+    TIMEOUTS: Optional[CacheTimeoutsModel] = None
     VERSION: int = 1
 
+    @root_validator(skip_on_failure=True)
+    def apply_timeouts(cls, values: dict) -> dict:
+        """
+        Translate TIMEOUTS into the socket timeout OPTIONS of the backend.
+        """
+        timeouts: Optional[CacheTimeoutsModel] = values.get("TIMEOUTS")
+        if timeouts:
+            values["OPTIONS"] = cache_options(
+                values["BACKEND"], values["OPTIONS"], timeouts.dict()
+            )
+        return values
+
+
+class CachePolicyModel(BaseModel):
+    """
+    A caching policy of pydantic_settings.cache_policies.CachePolicyMiddleware for the
+    request paths matching `path`: a path prefix, or a regular expression if it
+    starts with "^".
+    """
+
+    path: str
+    # How long to cache responses, 0 to bypass the cache.
+    seconds: int = 0
+    alias: str = "default"
+    key_prefix: str = ""
+    # Request headers to add to the Vary header of responses, so that they are
+    # cached separately per value (e.g. Accept-Language or Cookie).
+    vary: List[str] = []
+
+    @validator("path")
+    def compile_path(cls, path: str) -> str:
+        if path.startswith("^"):
+            try:
+                re.compile(path)
+            except re.error as exc:
+                raise ValueError(f"invalid regular expression: {exc}")
+        return path
+
+    @validator("seconds")
+    def positive_seconds(cls, seconds: int) -> int:
+        if seconds < 0:
+            raise ValueError("seconds can't be negative")
+        return seconds
+
 
 class DatabaseTestDict(TypedDict, total=False):
     CHARSET: Optional[str]
@@ -49,6 +105,14 @@ class DatabaseTestDict(TypedDict, total=False):
     DATAFILE_TMP_EXTSIZE: Optional[str]
 
 
+class DatabaseTimeoutsModel(BaseModel):
+    # Timeouts in seconds.
+    connect: Optional[PositiveFloat] = None
+    statement: Optional[PositiveFloat] = None
+    lock: Optional[PositiveFloat] = None
+    idle_in_transaction: Optional[PositiveFloat] = None
+
+
 class DatabaseModel(BaseModel):
     ATOMIC_REQUESTS: bool = False
     AUTOCOMMIT: bool = True
@@ -56,6 +120,7 @@ class DatabaseModel(BaseModel):
     HOST: str = ""
     NAME: str = ""
     CONN_MAX_AGE: int = 0
+    CONN_HEALTH_CHECKS: bool = False
     OPTIONS: dict = {}
     PASSWORD: str = ""
     PORT: str = ""
@@ -64,3 +129,70 @@ class DatabaseModel(BaseModel):
     USER: str = ""
     TEST: DatabaseTestDict = {}
     DATA_UPLOAD_MEMORY_MAX_SIZE: Optional[int] = None
+    TIMEOUTS: Optional[DatabaseTimeoutsModel] = None
+
+    @root_validator(skip_on_failure=True)
+    def apply_timeouts(cls, values: dict) -> dict:
+        """
+        Translate TIMEOUTS into the connection OPTIONS of the database engine.
+        """
+        timeouts: Optional[DatabaseTimeoutsModel] = values.get("TIMEOUTS")
+        if timeouts:
+            values["OPTIONS"] = database_options(
+                values["ENGINE"], values["OPTIONS"], timeouts.dict()
+            )
+        return values
+
+
+class EmailModel(BaseModel):
+    EMAIL_BACKEND: str
+    EMAIL_HOST: str = "localhost"
+    EMAIL_PORT: int = 25
+    EMAIL_HOST_USER: str = ""
+    EMAIL_HOST_PASSWORD: str = ""
+    EMAIL_USE_TLS: bool = False
+    EMAIL_USE_SSL: bool = False
+    EMAIL_SSL_CERTFILE: Optional[str] = None
+    EMAIL_SSL_KEYFILE: Optional[str] = None
+    EMAIL_TIMEOUT: Optional[int] = None
+    EMAIL_FILE_PATH: Optional[str] = None
+    EMAIL_POOL_SIZE: Optional[int] = None
+    EMAIL_POOL_IDLE_TIMEOUT: Optional[float] = None
+    EMAIL_POOL_MAX_MESSAGES: Optional[int] = None
+
+
+class SessionModel(BaseModel):
+    SESSION_ENGINE: str
+    SESSION_CACHE_ALIAS: Optional[str] = None
+    SESSION_SERIALIZER: Optional[str] = None
+    SESSION_FILE_PATH: Optional[str] = None
+    # The cache defined by the session URL, stored as SESSION_CACHE_ALIAS in CACHES.
+    CACHE: Optional[CacheModel] = None
+
+
+class LogQueueModel(BaseModel):
+    # The maximum number of queued records, 0 for an unbounded queue.
+    maxsize: int = 10000
+    # What to do with records when the queue is full: drop them, drop the oldest
+    # queued record to make room, or block until there is room.
+    overflow: Literal["drop", "drop_oldest", "block"] = "drop"
+
+
+class LoggingModel(BaseModel):
+    """
+    A logging.config.dictConfig() configuration, with an optional `queue` section
+    that moves handler I/O to a background thread (see pydantic_settings.log).
+    """
+
+    version: int = 1
+    incremental: Optional[bool] = None
+    disable_existing_loggers: bool = True
+    formatters: Dict[str, dict] = {}
+    filters: Dict[str, dict] = {}
+    handlers: Dict[str, dict] = {}
+    loggers: Dict[str, dict] = {}
+    root: Optional[dict] = None
+    queue: Optional[LogQueueModel] = None
+
+    class Config:
+        extra = Extra.allow
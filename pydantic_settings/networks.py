@@ -0,0 +1,164 @@
+import json
+import re
+from bisect import bisect_right
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+)
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pydantic.networks import IPvAnyNetwork
+
+IPNetwork = Union[IPv4Network, IPv6Network]
+
+# The host list of a multi-host URL, e.g. postgres://user@h1:5432,h2:5433/db
+_multi_host_url_regex = re.compile(
+    r"(?P<prefix>[^:/?#]+://(?:[^@/?#]*@)?)(?P<hosts>[^/?#]*,[^/?#]*)(?P<suffix>.*)",
+    re.DOTALL,
+)
+_host_port_regex = re.compile(
+    r"(?:\[(?P<ipv6>[^\]]+)\]|(?P<host>[\w.%-]+))(?::(?P<port>\d+))?", re.ASCII
+)
+
+
+def _merge_ranges(networks: Iterable[IPNetwork]) -> Tuple[List[int], List[int]]:
+    """
+    Merge networks into sorted, non-overlapping integer ranges, returning a list of
+    range starts and a list of (inclusive) range ends.
+    """
+    starts: List[int] = []
+    ends: List[int] = []
+    ranges = sorted(
+        (int(network.network_address), int(network.broadcast_address))
+        for network in networks
+    )
+    for start, end in ranges:
+        # Adjacent ranges are merged as well as overlapping ones.
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+class IPNetworkSet:
+    """
+    An immutable set of IPv4 and IPv6 networks.
+
+    Membership tests accept addresses (as strings or `ipaddress` objects) and are a
+    binary search over the merged ranges of each address family, so checking
+    `REMOTE_ADDR in INTERNAL_IPS` doesn't depend on the number of configured entries.
+    """
+
+    __slots__ = ("networks", "_v4", "_v6")
+
+    def __init__(self, networks: Iterable[Union[str, IPNetwork]] = ()):
+        self.networks: Tuple[IPNetwork, ...] = tuple(
+            IPvAnyNetwork.validate(network) for network in networks
+        )
+        self._v4 = _merge_ranges(
+            network for network in self.networks if network.version == 4
+        )
+        self._v6 = _merge_ranges(
+            network for network in self.networks if network.version == 6
+        )
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any) -> "IPNetworkSet":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            value = value.strip()
+            # Accept a JSON list, like other list settings, or a comma separated
+            # string of networks.
+            if value.startswith("["):
+                value = json.loads(value)
+            else:
+                value = [item for item in value.split(",") if item.strip()]
+        if isinstance(value, (IPv4Network, IPv6Network)):
+            value = [value]
+        return cls(item.strip() if isinstance(item, str) else item for item in value)
+
+    def __contains__(self, address: Any) -> bool:
+        if not isinstance(address, (IPv4Address, IPv6Address)):
+            try:
+                address = ip_address(address)
+            except ValueError:
+                return False
+        starts, ends = self._v4 if address.version == 4 else self._v6
+        value = int(address)
+        index = bisect_right(starts, value) - 1
+        return index >= 0 and value <= ends[index]
+
+    def __iter__(self) -> Iterator[IPNetwork]:
+        return iter(self.networks)
+
+    def __len__(self) -> int:
+        return len(self.networks)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, IPNetworkSet):
+            return self._v4 == other._v4 and self._v6 == other._v6
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((tuple(self._v4[0]), tuple(self._v6[0])))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({[str(n) for n in self.networks]!r})"
+
+
+def split_hosts(value: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Split a comma separated list of `host[:port]` entries, as used by libpq
+    multi-host connection strings, into (host, port) pairs. IPv6 addresses must be
+    enclosed in brackets, and are returned without them.
+    """
+    hosts: List[Tuple[str, Optional[str]]] = []
+    for entry in value.split(","):
+        m = _host_port_regex.fullmatch(entry.strip())
+        if not m:
+            raise ValueError(f"invalid host {entry!r}")
+        host = str(IPv6Address(m["ipv6"])) if m["ipv6"] else m["host"]
+        port = m["port"]
+        if port is not None and not 0 < int(port) < 65536:
+            raise ValueError(f"invalid port {port!r}")
+        hosts.append((host, port))
+    return hosts
+
+
+def join_host(host: str, port: Optional[str] = None) -> str:
+    """The `host[:port]` form of a host and port, with IPv6 addresses in brackets."""
+    if ":" in host:
+        host = f"[{host}]"
+    return f"{host}:{port}" if port else host
+
+
+def split_multi_host_url(url: str) -> Tuple[str, List[Tuple[str, Optional[str]]]]:
+    """
+    Split a URL with a comma separated list of hosts into the same URL with only its
+    first host, and the list of (host, port) pairs. URLs with a single host are
+    returned unchanged, with an empty list of hosts.
+    """
+    m = _multi_host_url_regex.fullmatch(url)
+    if not m:
+        return url, []
+    hosts = split_hosts(m["hosts"])
+    return m["prefix"] + join_host(*hosts[0]) + m["suffix"], hosts
+
+
+def parse_bool(value: str) -> bool:
+    """Parse a boolean URL query argument, e.g. `?ssl=true` or `?ssl=0`."""
+    if value.lower() in ("1", "true", "yes", "on"):
+        return True
+    if value.lower() in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"invalid boolean value {value!r}")
@@ -0,0 +1,263 @@
+"""
+Latency probes of the configured backends.
+
+`probe()` connects to every database and cache alias, and to the SMTP server of the
+email settings, several times and measures how long it takes to connect and how
+long a round trip (`SELECT 1`, a cache read, an SMTP NOOP) takes once connected. The
+aliases are probed concurrently, each with fresh connections that aren't shared with
+the rest of the process.
+
+A slow connect with fast round trips points at the configuration (TLS and
+authentication on every connection, no persistent connections), while slow round
+trips point at the network or the server. `suggest()` turns the measurements into
+settings worth changing. Both are used by the `probe_backends` management command.
+"""
+
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import connections
+from django.utils.module_loading import import_string
+
+from pydantic_settings.checks import LOCAL_DATABASE_ENGINES
+from pydantic_settings.timeouts import cache_options, database_options
+from pydantic_settings.warmup import DUMMY_DATABASE_ENGINE
+
+PERCENTILES = (50, 90, 99)
+PROBE_CACHE_KEY = "pydantic_settings.probe"
+SMTP_BACKENDS = (
+    "django.core.mail.backends.smtp.EmailBackend",
+    "pydantic_settings.backends.smtp.PooledEmailBackend",
+)
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.dummy.DummyCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+    "pydantic_settings.backends.locmem.BoundedLocMemCache",
+    "django.core.cache.backends.filebased.FileBasedCache",
+    "pydantic_settings.backends.filebased.ShardedFileBasedCache",
+)
+
+# Connecting taking more than this many round trips means that connections are
+# expensive to set up, rather than the network being slow.
+SLOW_CONNECT_RATIO = 5
+# Suggested timeouts leave this much headroom over the slowest probe.
+TIMEOUT_HEADROOM = 10
+
+Sample = Tuple[float, float]
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    """Return the (nearest rank) percentiles and the maximum of the values."""
+    values = sorted(values)
+    result = {
+        f"p{p}": values[max(math.ceil(p / 100 * len(values)) - 1, 0)]
+        for p in PERCENTILES
+    }
+    result["max"] = values[-1]
+    return result
+
+
+def _connect_timeout(config: Dict[str, Any], timeout: float) -> float:
+    # The connect timeout of an alias, if it has one, unless it is longer than the
+    # time left to probe it.
+    connect = (config.get("TIMEOUTS") or {}).get("connect")
+    return min(connect, timeout) if connect else timeout
+
+
+def _probe_database(alias: str, timeout: float) -> Sample:
+    connection = connections.create_connection(alias)
+    settings_dict = connection.settings_dict
+    try:
+        options = database_options(
+            settings_dict["ENGINE"],
+            settings_dict.get("OPTIONS") or {},
+            {"connect": _connect_timeout(settings_dict, timeout)},
+        )
+    except ValueError:
+        # Local databases don't have connect timeouts.
+        pass
+    else:
+        connection.settings_dict = {**settings_dict, "OPTIONS": options}
+    try:
+        start = time.perf_counter()
+        connection.ensure_connection()
+        connected = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        return connected - start, time.perf_counter() - connected
+    finally:
+        connection.close()
+
+
+def _probe_cache(alias: str, timeout: float) -> Sample:
+    params = dict(settings.CACHES[alias])
+    backend = params.pop("BACKEND")
+    location = params.pop("LOCATION", "")
+    connect = _connect_timeout(params, timeout)
+    try:
+        params["OPTIONS"] = cache_options(
+            backend, params.get("OPTIONS") or {}, {"connect": connect, "read": timeout}
+        )
+    except ValueError:
+        # Local and custom backends don't have socket timeouts.
+        pass
+    cache = import_string(backend)(location, params)
+    try:
+        # Backends connect lazily, so the first read includes connecting.
+        start = time.perf_counter()
+        cache.get(PROBE_CACHE_KEY)
+        connected = time.perf_counter()
+        cache.get(PROBE_CACHE_KEY)
+        return connected - start, time.perf_counter() - connected
+    finally:
+        cache.close()
+
+
+def _probe_email(timeout: float) -> Sample:
+    # Always probe with Django's own backend, so that pooled connections aren't
+    # reused.
+    if settings.EMAIL_TIMEOUT:
+        timeout = min(settings.EMAIL_TIMEOUT, timeout)
+    backend = get_connection(SMTP_BACKENDS[0], fail_silently=False, timeout=timeout)
+    try:
+        start = time.perf_counter()
+        backend.open()
+        connected = time.perf_counter()
+        backend.connection.noop()
+        return connected - start, time.perf_counter() - connected
+    finally:
+        backend.close()
+
+
+def _run(
+    probe: Callable[[float], Sample], samples: int, start: float, timeout: float
+) -> Dict[str, Any]:
+    # Every sample is given the time left as its timeout, and no sample is started
+    # after the deadline.
+    results = []
+    for _ in range(samples):
+        remaining = start + timeout - time.monotonic()
+        if remaining <= 0:
+            break
+        results.append(probe(remaining))
+    if not results:
+        raise TimeoutError(f"timed out after {timeout:g}s")
+    connect, rtt = zip(*results)
+    return {"connect": percentiles(list(connect)), "rtt": percentiles(list(rtt))}
+
+
+def probe(samples: int = 10, timeout: float = 30.0) -> Dict[str, Dict[str, Any]]:
+    """
+    Probe every database and cache alias and the SMTP server (if EMAIL_HOST is set)
+    `samples` times, and return the percentiles of the connect and round trip times,
+    in seconds::
+
+        {
+            "databases": {
+                "default": {
+                    "connect": {"p50": 0.012, "p90": 0.015, "p99": 0.02, "max": 0.02},
+                    "rtt": {"p50": 0.0004, "p90": ..., "p99": ..., "max": ...},
+                },
+            },
+            "caches": {"default": {"error": "ConnectionRefusedError: ..."}},
+            "email": {},
+        }
+
+    Probing stops after `timeout` seconds: the connections of the probes are given
+    the time left as their connect (and, for caches and email, read) timeout, and
+    the results of an alias only include the samples that finished in time.
+    """
+    probes: List[Tuple[str, str, Callable[[float], Sample]]] = [
+        ("databases", alias, partial(_probe_database, alias))
+        for alias, config in settings.DATABASES.items()
+        if config.get("ENGINE") != DUMMY_DATABASE_ENGINE
+    ]
+    probes += [
+        ("caches", alias, partial(_probe_cache, alias)) for alias in settings.CACHES
+    ]
+    if settings.EMAIL_BACKEND in SMTP_BACKENDS and settings.is_overridden("EMAIL_HOST"):
+        probes.append(("email", "smtp", _probe_email))
+
+    report: Dict[str, Dict[str, Any]] = {"databases": {}, "caches": {}, "email": {}}
+    if not probes:
+        return report
+    start = time.monotonic()
+    with ThreadPoolExecutor(len(probes), thread_name_prefix="probe") as executor:
+        futures = [
+            (kind, name, executor.submit(_run, func, samples, start, timeout))
+            for kind, name, func in probes
+        ]
+    for kind, name, future in futures:
+        try:
+            report[kind][name] = future.result()
+        except Exception as exc:
+            report[kind][name] = {"error": f"{exc.__class__.__name__}: {exc}"}
+    return report
+
+
+def _suggested_timeout(seconds: float) -> float:
+    # One significant digit, and no less than 100ms.
+    seconds = max(seconds * TIMEOUT_HEADROOM, 0.1)
+    return float(f"{seconds:.1g}")
+
+
+def _slow_connect(result: Dict[str, Any]) -> bool:
+    return (
+        result["connect"]["p50"] > SLOW_CONNECT_RATIO * result["rtt"]["p50"]
+        and result["connect"]["p50"] > 0.001
+    )
+
+
+def suggest(report: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Return suggested settings changes for the results of `probe()`."""
+    suggestions = []
+    for alias, result in report["databases"].items():
+        if "error" in result:
+            continue
+        config = settings.DATABASES[alias]
+        if config.get("ENGINE") in LOCAL_DATABASE_ENGINES:
+            continue
+        if _slow_connect(result) and not config.get("CONN_MAX_AGE"):
+            suggestions.append(
+                f"Database {alias!r}: connecting takes "
+                f"{result['connect']['p50'] * 1000:.1f}ms, "
+                f"{result['connect']['p50'] / result['rtt']['p50']:.0f} round trips; "
+                "keep connections open with CONN_MAX_AGE (?conn_max_age=60)."
+            )
+        if not (config.get("TIMEOUTS") or {}).get("connect"):
+            suggestions.append(
+                f"Database {alias!r}: set a connect timeout, e.g. "
+                f"?connect_timeout={_suggested_timeout(result['connect']['max']):g}."
+            )
+    for alias, result in report["caches"].items():
+        if "error" in result:
+            continue
+        config = settings.CACHES[alias]
+        if config.get("BACKEND") in LOCAL_CACHE_BACKENDS:
+            continue
+        timeouts = config.get("TIMEOUTS") or {}
+        for name, measured in (("connect", "connect"), ("read", "rtt")):
+            if not timeouts.get(name):
+                suggested = _suggested_timeout(result[measured]["max"])
+                suggestions.append(
+                    f"Cache {alias!r}: set a {name} timeout, e.g. "
+                    f"?{name}_timeout={suggested:g}."
+                )
+    smtp: Optional[Dict[str, Any]] = report["email"].get("smtp")
+    if (
+        smtp
+        and "error" not in smtp
+        and _slow_connect(smtp)
+        and settings.EMAIL_BACKEND == SMTP_BACKENDS[0]
+    ):
+        suggestions.append(
+            f"Email: connecting takes {smtp['connect']['p50'] * 1000:.1f}ms; keep "
+            "SMTP connections open with a +pool EMAIL_URL scheme."
+        )
+    return suggestions
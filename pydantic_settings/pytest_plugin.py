@@ -0,0 +1,144 @@
+"""
+pytest plugin providing a `configure_settings` fixture that configures Django with
+memoized `PydanticSettings`.
+
+Enable it in your `conftest.py` with::
+
+    pytest_plugins = ["pydantic_settings.pytest_plugin"]
+"""
+
+import copy
+import inspect
+import os
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple, Type
+
+import pytest
+from django.conf import settings
+from django.utils.functional import empty
+
+from pydantic_settings.settings import PydanticSettings, SetUp, export_settings
+
+_settings_cache: Dict[Hashable, Tuple[PydanticSettings, Dict[str, Any]]] = {}
+
+
+def _env_files(settings_class: Type[PydanticSettings]) -> Tuple[Hashable, ...]:
+    """Return the paths and contents of the env files of a settings class."""
+    env_file = settings_class.__config__.env_file
+    if env_file is None:
+        return ()
+    if isinstance(env_file, (str, os.PathLike)):
+        env_file = [env_file]
+    files = []
+    for path in map(Path, env_file):
+        path = path.expanduser()
+        files.append((str(path), path.read_bytes() if path.is_file() else None))
+    return tuple(files)
+
+
+def _secrets(settings_class: Type[PydanticSettings]) -> Tuple[Hashable, ...]:
+    """Return the names and contents of the files in the secrets directory."""
+    secrets_dir = settings_class.__config__.secrets_dir
+    if secrets_dir is None:
+        return ()
+    path = Path(secrets_dir).expanduser()
+    if not path.is_dir():
+        return ()
+    return tuple(
+        (child.name, child.read_bytes())
+        for child in sorted(path.iterdir())
+        if child.is_file()
+    )
+
+
+def _cache_key(settings_class: Type[PydanticSettings]) -> Tuple[Hashable, ...]:
+    """
+    Key memoized settings by the settings class, the environment variables that it
+    reads and the contents of its env files and secrets directory.
+    """
+    case_sensitive = settings_class.__config__.case_sensitive
+    environ = (
+        os.environ
+        if case_sensitive
+        else {key.lower(): value for key, value in os.environ.items()}
+    )
+    env_names = sorted(
+        {
+            env_name
+            for field in settings_class.__fields__.values()
+            for env_name in field.field_info.extra.get("env_names", ())
+        }
+    )
+    return (
+        settings_class,
+        _env_files(settings_class),
+        _secrets(settings_class),
+        *((name, environ.get(name)) for name in env_names),
+    )
+
+
+def configure(**overrides: Any) -> None:
+    """
+    (Re)configure the Django settings from the settings class named by the
+    `DJANGO_SETTINGS_MODULE` environment variable.
+
+    Validated settings are memoized per settings class and environment, so only the
+    first test using a given environment pays for validating the whole class.
+    `overrides` of fields are applied with `PydanticSettings.derive()`, which only
+    validates them and runs the root validators again, so that overriding e.g.
+    `default_database_dsn` updates DATABASES. Other overrides are applied to the
+    Django settings as they are.
+    """
+    settings_module = SetUp().DJANGO_SETTINGS_MODULE
+    if inspect.isclass(settings_module):
+        key = _cache_key(settings_module)
+        memoized = _settings_cache.get(key)
+        if memoized is None:
+            settings_obj = settings_module()
+            memoized = _settings_cache[key] = (
+                settings_obj,
+                export_settings(settings_obj),
+            )
+        settings_obj, settings_dict = memoized
+    else:
+        settings_obj = settings_module
+        settings_dict = export_settings(settings_obj)
+
+    fields = {
+        name: value
+        for name, value in overrides.items()
+        if name in settings_obj.__fields__
+    }
+    if fields:
+        settings_dict = export_settings(settings_obj.derive(**fields))
+    # Tests (and Django's test runner) can modify settings in place, so every test
+    # gets its own copy of the memoized settings.
+    settings_dict = copy.deepcopy(settings_dict)
+    settings_dict.update(
+        (name, value) for name, value in overrides.items() if name not in fields
+    )
+
+    settings._wrapped = empty
+    settings.configure(**settings_dict)
+
+
+@pytest.fixture()
+def configure_settings(monkeypatch):
+    """
+    Configure the Django settings for a test, optionally setting environment
+    variables and overriding individual settings first::
+
+        def test_debug(configure_settings):
+            configure_settings({"DATABASE_URL": "sqlite:///test.db"}, DEBUG=True)
+
+    The Django settings are reset after the test.
+    """
+    settings._wrapped = empty
+
+    def func(env: Optional[Dict[str, str]] = None, **overrides: Any) -> None:
+        for key, value in (env or {}).items():
+            monkeypatch.setenv(key, value)
+        configure(**overrides)
+
+    yield func
+    settings._wrapped = empty
@@ -0,0 +1,125 @@
+"""
+Consistent hash sharding of database aliases.
+
+`ShardRouter` is a database router that sends queries to one of a set of shard
+databases, chosen by hashing a shard key (e.g. a tenant id) onto a `HashRing`. It is
+added to DATABASE_ROUTERS by `PydanticSettings` when DATABASE_SHARD_URLS is set.
+"""
+
+from bisect import bisect_right
+from hashlib import blake2b
+from typing import Any, Hashable, List, Optional, Sequence
+
+from django.db import router
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    A consistent hash ring of nodes, each placed at `vnodes` points of the ring, so
+    that adding or removing a node only moves the keys of that node.
+    """
+
+    __slots__ = ("nodes", "vnodes", "_points", "_nodes")
+
+    def __init__(self, nodes: Sequence[str], vnodes: int = 64):
+        if not nodes:
+            raise ValueError("a hash ring needs at least one node")
+        if vnodes < 1:
+            raise ValueError("vnodes must be at least 1")
+        self.nodes = tuple(nodes)
+        self.vnodes = vnodes
+        ring = sorted(
+            (_hash(f"{node}#{index}"), node)
+            for node in self.nodes
+            for index in range(vnodes)
+        )
+        self._points: List[int] = [point for point, _ in ring]
+        self._nodes: List[str] = [node for _, node in ring]
+
+    def get(self, key: Hashable) -> str:
+        """Return the node of a key."""
+        index = bisect_right(self._points, _hash(str(key)))
+        return self._nodes[index % len(self._nodes)]
+
+
+class ShardRouter:
+    """
+    Route reads and writes to a shard database, chosen by the `shard_key` hint::
+
+        Order.objects.db_manager(hints={"shard_key": tenant_id}).filter(...)
+
+    or by the `shard_key` attribute of model instances that haven't been saved yet
+    (saved instances stay on the database they were loaded from). Queries without a
+    shard key are left to the next router.
+    """
+
+    def __init__(self, shards: Sequence[str], vnodes: int = 64):
+        self.ring = HashRing(shards, vnodes)
+        self.shards = frozenset(shards)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ShardRouter):
+            return (self.ring.nodes, self.ring.vnodes) == (
+                other.ring.nodes,
+                other.ring.vnodes,
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.ring.nodes, self.ring.vnodes))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.ring.nodes)!r})"
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any) -> "ShardRouter":
+        if not isinstance(value, cls):
+            raise TypeError(f"expected a {cls.__name__}")
+        return value
+
+    def shard_for(self, key: Hashable) -> str:
+        """Return the database alias of the shard of a key."""
+        return self.ring.get(key)
+
+    def _db_for(self, hints) -> Optional[str]:
+        if "shard_key" in hints:
+            return self.shard_for(hints["shard_key"])
+        instance = hints.get("instance")
+        if instance is not None:
+            if instance._state.db in self.shards:
+                return instance._state.db
+            shard_key = getattr(instance, "shard_key", None)
+            if shard_key is not None:
+                return self.shard_for(shard_key)
+        return None
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        return self._db_for(hints)
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        return self._db_for(hints)
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        db1, db2 = obj1._state.db, obj2._state.db
+        if db1 in self.shards or db2 in self.shards:
+            return db1 == db2
+        return None
+
+
+def shard_for(key: Hashable) -> str:
+    """
+    Return the database alias of the shard of a key, using the first ShardRouter in
+    DATABASE_ROUTERS.
+    """
+    for database_router in router.routers:
+        if isinstance(database_router, ShardRouter):
+            return database_router.shard_for(key)
+    raise LookupError("no ShardRouter is configured in DATABASE_ROUTERS")
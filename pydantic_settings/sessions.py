@@ -0,0 +1,113 @@
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode
+
+from pydantic import AnyUrl, parse_obj_as
+
+from pydantic_settings.cache import CACHE_ENGINES, CacheDsn
+from pydantic_settings.models import SessionModel
+
+SESSION_ENGINES = {
+    "cache": "django.contrib.sessions.backends.cache",
+    "cached-db": "django.contrib.sessions.backends.cached_db",
+    "db": "django.contrib.sessions.backends.db",
+    "file": "django.contrib.sessions.backends.file",
+    "signed-cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+
+CACHE_SESSION_ENGINES = ("cache", "cached-db")
+
+SESSION_SERIALIZERS = {
+    "json": "django.contrib.sessions.serializers.JSONSerializer",
+}
+
+# The cache alias of a cache defined by the session URL, e.g. cache+redis://...
+DEFAULT_SESSION_CACHE_ALIAS = "sessions"
+
+SESSION_SCHEMES = set(SESSION_ENGINES) | {
+    f"{engine}+{cache_scheme}"
+    for engine in CACHE_SESSION_ENGINES
+    for cache_scheme in CACHE_ENGINES
+}
+
+
+class SessionDsn(AnyUrl):
+    __slots__ = AnyUrl.__slots__ + ("query_args",)
+    allowed_schemes = SESSION_SCHEMES
+    host_required = False
+
+    query_args: Dict[str, str]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.query_args = dict(parse_qsl(self.query)) if self.query else {}
+
+    @classmethod
+    def validate(cls, value, field, config):
+        # URL schemes can't contain underscores, so accept the engine names
+        # (cached_db, signed_cookies) with dashes instead.
+        if isinstance(value, str) and "://" in value:
+            scheme, rest = value.split("://", 1)
+            value = f"{scheme.replace('_', '-')}://{rest}"
+        dsn = super().validate(value, field, config)
+        # Parse the DSN up front so that invalid query arguments and cache URLs are
+        # reported as a validation error of the field.
+        parse(dsn)
+        return dsn
+
+    @property
+    def engine(self) -> str:
+        return self.scheme.partition("+")[0]
+
+    @property
+    def cache_dsn(self) -> Optional[CacheDsn]:
+        """The URL of the cache defined by a cache+<cache URL> session URL."""
+        _, _, cache_scheme = self.scheme.partition("+")
+        if not cache_scheme:
+            return None
+        query_args = {
+            key: value
+            for key, value in self.query_args.items()
+            if key not in ("alias", "serializer")
+        }
+        url = CacheDsn.build(
+            scheme=cache_scheme,
+            user=self.user,
+            password=self.password,
+            host=self.host or "",
+            port=self.port,
+            path=self.path,
+            query=urlencode(query_args) or None,
+        )
+        return parse_obj_as(CacheDsn, url)
+
+    def to_settings_model(self) -> SessionModel:
+        return SessionModel(**parse(self))
+
+
+def parse(dsn: SessionDsn) -> Dict[str, Any]:
+    """Parses a session URL."""
+    engine = dsn.engine
+    query_args = dsn.query_args.copy()
+    config: Dict[str, Any] = {"SESSION_ENGINE": SESSION_ENGINES[engine]}
+
+    if serializer := query_args.pop("serializer", None):
+        serializer = SESSION_SERIALIZERS.get(serializer, serializer)
+        if "." not in serializer:
+            raise ValueError(f"unknown session serializer {serializer!r}")
+        config["SESSION_SERIALIZER"] = serializer
+
+    if engine in CACHE_SESSION_ENGINES:
+        cache_dsn = dsn.cache_dsn
+        default_alias = DEFAULT_SESSION_CACHE_ALIAS if cache_dsn else "default"
+        config["SESSION_CACHE_ALIAS"] = query_args.pop("alias", default_alias)
+        if cache_dsn:
+            config["CACHE"] = cache_dsn.to_settings_model()
+            # The remaining query arguments belong to the cache URL.
+            query_args.clear()
+    elif engine == "file" and dsn.path:
+        config["SESSION_FILE_PATH"] = dsn.path
+
+    if query_args:
+        raise ValueError(f"unsupported query arguments: {', '.join(query_args)}")
+
+    return config
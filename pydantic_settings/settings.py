@@ -1,14 +1,22 @@
 import inspect
-from pathlib import Path
+import json
+import os
+import re
+import sys
+from contextvars import ContextVar
+from hashlib import blake2b
+from pathlib import Path, PurePath
 from typing import (
     Any,
     Callable,
     Dict,
     Iterable,
     List,
+    Mapping,
     Optional,
     Pattern,
     Sequence,
+    Set,
     Tuple,
     Union,
 )
@@ -16,21 +24,40 @@ from typing import (
 from django.conf import global_settings, settings
 from django.core.management.utils import get_random_secret_key
 from pydantic import (
+    BaseModel,
     BaseSettings,
     DirectoryPath,
     Field,
+    PrivateAttr,
     PyObject,
+    ValidationError,
     parse_obj_as,
     root_validator,
     validator,
 )
+from pydantic.env_settings import EnvSettingsSource, SettingsError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import ExtraError
 from pydantic.fields import ModelField
-from pydantic.networks import EmailStr, IPvAnyAddress
+from pydantic.main import validate_model
+from pydantic.networks import EmailStr
 from pydantic.types import FilePath
+from pydantic.utils import ROOT_KEY
 
 from pydantic_settings.cache import CacheDsn
 from pydantic_settings.database import DatabaseDsn
-from pydantic_settings.models import CacheModel, DatabaseModel, TemplateBackendModel
+from pydantic_settings.email import EmailDsn
+from pydantic_settings.models import (
+    CacheModel,
+    CachePolicyModel,
+    DatabaseModel,
+    LoggingModel,
+    LogQueueModel,
+    TemplateBackendModel,
+)
+from pydantic_settings.networks import IPNetworkSet
+from pydantic_settings.routers import ShardRouter
+from pydantic_settings.sessions import SessionDsn
 
 try:
     from typing import Literal
@@ -38,6 +65,8 @@ except ImportError:
     from typing_extensions import Literal
 
 
+LogLevel = Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"]
+
 DEFAULT_SETTINGS_MODULE_FIELD = Field(
     "pydantic_settings.settings.PydanticSettings", env="DJANGO_SETTINGS_MODULE"
 )
@@ -45,6 +74,8 @@ DEFAULT_SETTINGS_MODULE_FIELD = Field(
 
 class SetUp(BaseSettings):
     DJANGO_SETTINGS_MODULE: PyObject = "pydantic_settings.settings.PydanticSettings"
+    # Count the reads of settings, see pydantic_settings.instrumentation.
+    DJANGO_SETTINGS_INSTRUMENT: bool = False
 
     def configure(self):
         if settings.configured:
@@ -58,26 +89,202 @@ class SetUp(BaseSettings):
         else:
             settings_obj = self.DJANGO_SETTINGS_MODULE
 
-        settings_dict = {
-            key: value
-            for key, value in settings_obj.dict().items()
-            if key == key.upper()
-            and (
-                hasattr(global_settings, key) is False
-                # Running the test suite can modify settings.DATABASES, so always
-                # override the mutable global_settings.DATABASES.
-                or key == "DATABASES"
-                or value != getattr(global_settings, key)
-            )
-        }
-        settings.configure(**settings_dict)
+        settings.configure(**export_settings(settings_obj))
+        if self.DJANGO_SETTINGS_INSTRUMENT:
+            from pydantic_settings import instrumentation
+
+            instrumentation.enable()
         return True
 
 
+def export_settings(settings_obj: "PydanticSettings") -> Dict[str, Any]:
+    """
+    Return the Django settings of a settings object, leaving out any that are the
+    same as Django's defaults.
+
+    Values are shared with the settings object rather than copied; only models are
+    converted to the plain dicts Django expects.
+    """
+    settings_dict = {}
+    for key, value in settings_obj.__dict__.items():
+        if key != key.upper():
+            continue
+        if hasattr(global_settings, key) and key != "DATABASES":
+            # Running the test suite can modify settings.DATABASES, so always
+            # override the mutable global_settings.DATABASES.
+            default = getattr(global_settings, key)
+            if value is default or value == default:
+                continue
+        settings_dict[key] = _export_value(value)
+    return settings_dict
+
+
+def _export_value(value: Any) -> Any:
+    """
+    Convert any models in a setting's value to dicts. Containers that don't hold any
+    models are returned as they are.
+    """
+    if isinstance(value, BaseModel):
+        return {key: _export_value(item) for key, item in value.__dict__.items()}
+    if isinstance(value, dict):
+        exported = {key: _export_value(item) for key, item in value.items()}
+        if any(exported[key] is not item for key, item in value.items()):
+            return exported
+    elif isinstance(value, (list, tuple)):
+        items = [_export_value(item) for item in value]
+        if any(new is not old for new, old in zip(items, value)):
+            return value.__class__(items)
+    return value
+
+
+# Settings (and keys of DATABASES, CACHES...) left out of settings fingerprints.
+SECRET_SETTINGS = re.compile(r"PASSWORD|SECRET|TOKEN|API_KEY", re.IGNORECASE)
+# Keys of CACHES that a fingerprint can be injected into.
+FINGERPRINT_CACHE_KEYS = ("KEY_PREFIX", "VERSION")
+# Settings holding the directory of a deploy, which can change with every release.
+DEPLOY_PATH_SETTINGS = ("BASE_DIR",)
+
+
+def _fingerprint_value(value: Any) -> Any:
+    """
+    Return a JSON serializable stand-in for a setting value that json.dumps() can't
+    serialize, which is stable across processes.
+    """
+    if isinstance(value, BaseModel):
+        return value.__dict__
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, Pattern):
+        return value.pattern
+    if isinstance(value, type) or inspect.isroutine(value):
+        return f"{value.__module__}.{value.__qualname__}"
+    text = repr(value)
+    if " at 0x" in text:
+        # The default repr of objects includes their address.
+        return f"{type(value).__module__}.{type(value).__qualname__}"
+    return text
+
+
+def _fingerprinted(
+    value: Any, base_dir: Optional[str] = None, cache_setting: bool = False
+) -> Any:
+    """
+    Return a setting value without its secrets, and with the paths under `base_dir`
+    made relative to it.
+    """
+    if isinstance(value, BaseModel):
+        value = value.__dict__
+    if isinstance(value, dict):
+        return {
+            key: _fingerprinted(item, base_dir)
+            for key, item in value.items()
+            if not (isinstance(key, str) and SECRET_SETTINGS.search(key))
+            and not (cache_setting and key in FINGERPRINT_CACHE_KEYS)
+        }
+    if isinstance(value, (list, tuple)):
+        return [_fingerprinted(item, base_dir) for item in value]
+    if base_dir and isinstance(value, (str, PurePath)):
+        path = str(value)
+        if path == base_dir or path.startswith(base_dir + os.sep):
+            return "$BASE_DIR" + path[len(base_dir) :]
+    return value
+
+
+def settings_fingerprint(
+    values: Mapping[str, Any],
+    names: Optional[Iterable[str]] = None,
+    code_version: Optional[str] = None,
+) -> str:
+    """
+    Return a stable hash of the Django (uppercase) settings in `values`, or of the
+    settings named by `names`, and of a code version.
+
+    Secrets (passwords, tokens, SECRET_KEY...) are left out, and so are the
+    KEY_PREFIX and VERSION of caches, which the fingerprint may be injected into.
+    BASE_DIR is left out unless it is named, and paths under it are hashed relative
+    to it, so that deploying to a new release directory keeps the same fingerprint.
+    """
+    if names is None:
+        names = [
+            name
+            for name in values
+            if name.isupper() and name not in DEPLOY_PATH_SETTINGS
+        ]
+    base_dir = str(values["BASE_DIR"]) if values.get("BASE_DIR") else None
+    fingerprinted = {
+        name: _fingerprinted(values.get(name), base_dir)
+        if name != "CACHES"
+        else {
+            alias: _fingerprinted(cache, base_dir, cache_setting=True)
+            for alias, cache in (values.get(name) or {}).items()
+        }
+        for name in sorted(names)
+        if not SECRET_SETTINGS.search(name)
+    }
+    data = json.dumps(
+        [fingerprinted, code_version], sort_keys=True, default=_fingerprint_value
+    )
+    return blake2b(data.encode(), digest_size=8).hexdigest()
+
+
+def configured_settings_size() -> int:
+    """
+    Return the approximate number of bytes retained by the values of the configured
+    Django settings, excluding those that fall back to Django's defaults.
+    """
+    if not settings.configured:
+        return 0
+    holder = settings._wrapped
+    seen: Set[int] = set()
+    return sum(
+        _deep_getsizeof(value, seen)
+        for key, value in holder.__dict__.items()
+        if key.isupper()
+    )
+
+
+def _deep_getsizeof(value: Any, seen: Set[int]) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            _deep_getsizeof(key, seen) + _deep_getsizeof(item, seen)
+            for key, item in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_deep_getsizeof(item, seen) for item in value)
+    return size
+
+
 def _get_default_setting(setting: str) -> Any:
     return getattr(global_settings, setting, None)
 
 
+# The inputs and validated field values of the PydanticSettings being validated, which
+# are kept for PydanticSettings.derive().
+_validation_state: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "pydantic_settings_validation_state", default=None
+)
+
+
+# Settings that root validators update in place, adding or replacing aliases.
+ROOT_VALIDATED_SETTINGS = ("DATABASES", "CACHES")
+
+
+def _copy_field_values(values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy validated field values, with their own copy of the settings that root
+    validators update in place. The other values are shared.
+    """
+    values = dict(values)
+    for key in ROOT_VALIDATED_SETTINGS:
+        if isinstance(values.get(key), dict):
+            values[key] = dict(values[key])
+    return values
+
+
 class PydanticSettings(BaseSettings):
     BASE_DIR: Optional[DirectoryPath] = None
 
@@ -86,7 +293,9 @@ class PydanticSettings(BaseSettings):
         bool
     ] = global_settings.DEBUG_PROPAGATE_EXCEPTIONS
     ADMINS: Optional[List[Tuple[str, EmailStr]]] = _get_default_setting("ADMIN")
-    INTERNAL_IPS: Optional[List[IPvAnyAddress]] = _get_default_setting("INTERNAL_IPS")
+    # Accepts addresses and networks (e.g. "10.0.0.0/8") and validates to an
+    # IPNetworkSet, which answers `REMOTE_ADDR in INTERNAL_IPS` with a binary search.
+    INTERNAL_IPS: Optional[IPNetworkSet] = _get_default_setting("INTERNAL_IPS")
 
     # Would be nice to do something like Union[Literal["*"], IPvAnyAddress, AnyUrl], but
     # there are a lot of different options that need to be valid and don't necessarily
@@ -127,7 +336,7 @@ class PydanticSettings(BaseSettings):
 
     DATABASES: Dict[str, DatabaseModel] = global_settings.DATABASES  # type: ignore
     DATABASE_ROUTERS: Optional[
-        List[str]
+        List[Union[str, ShardRouter]]
     ] = global_settings.DATABASE_ROUTERS  # type: ignore
     EMAIL_BACKEND: Optional[str] = global_settings.EMAIL_BACKEND
     EMAIL_HOST: Optional[str] = global_settings.EMAIL_HOST
@@ -144,6 +353,11 @@ class PydanticSettings(BaseSettings):
         FilePath
     ] = global_settings.EMAIL_SSL_KEYFILE  # type: ignore
     EMAIL_TIMEOUT: Optional[int] = global_settings.EMAIL_TIMEOUT
+    EMAIL_FILE_PATH: Optional[str] = _get_default_setting("EMAIL_FILE_PATH")
+    # Settings of pydantic_settings.backends.smtp.PooledEmailBackend.
+    EMAIL_POOL_SIZE: Optional[int] = None
+    EMAIL_POOL_IDLE_TIMEOUT: Optional[float] = None
+    EMAIL_POOL_MAX_MESSAGES: Optional[int] = None
     INSTALLED_APPS: Optional[List[str]] = global_settings.INSTALLED_APPS
     TEMPLATES: Optional[
         List[TemplateBackendModel]
@@ -241,6 +455,8 @@ class PydanticSettings(BaseSettings):
     ] = global_settings.CACHE_MIDDLEWARE_KEY_PREFIX
     CACHE_MIDDLEWARE_SECONDS: Optional[int] = global_settings.CACHE_MIDDLEWARE_SECONDS
     CACHE_MIDDLEWARE_ALIAS: Optional[str] = global_settings.CACHE_MIDDLEWARE_ALIAS
+    # Per-path caching policies, see pydantic_settings.cache_policies.
+    CACHE_MIDDLEWARE_POLICIES: List[CachePolicyModel] = []
     AUTH_USER_MODEL: Optional[str] = global_settings.AUTH_USER_MODEL
     AUTHENTICATION_BACKENDS: Optional[
         Sequence[str]
@@ -275,7 +491,7 @@ class PydanticSettings(BaseSettings):
     CSRF_USE_SESSIONS: Optional[bool] = global_settings.CSRF_USE_SESSIONS
     MESSAGE_STORAGE: Optional[str] = global_settings.MESSAGE_STORAGE
     LOGGING_CONFIG: Optional[str] = global_settings.LOGGING_CONFIG
-    LOGGING: Optional[dict] = global_settings.LOGGING
+    LOGGING: Optional[LoggingModel] = global_settings.LOGGING
     DEFAULT_EXCEPTION_REPORTER: Optional[str] = _get_default_setting(
         "DEFAULT_EXCEPTION_REPORTER"
     )
@@ -293,6 +509,7 @@ class PydanticSettings(BaseSettings):
         List[DirectoryPath]
     ] = global_settings.STATICFILES_DIRS  # type: ignore
     STATICFILES_STORAGE: Optional[str] = global_settings.STATICFILES_STORAGE
+    STORAGES: Optional[Dict[str, Dict[str, Any]]] = _get_default_setting("STORAGES")
     STATICFILES_FINDERS: Optional[List[str]] = global_settings.STATICFILES_FINDERS
     MIGRATION_MODULES: Optional[Dict[str, str]] = global_settings.MIGRATION_MODULES
     SILENCED_SYSTEM_CHECKS: Optional[List[str]] = global_settings.SILENCED_SYSTEM_CHECKS
@@ -333,10 +550,241 @@ class PydanticSettings(BaseSettings):
     default_cache_dsn: Optional[CacheDsn] = Field(
         env="CACHE_URL", configure_cache="default"
     )
+    # Shard databases, added to DATABASES as <prefix>0, <prefix>1, ... and routed to
+    # by a ShardRouter.
+    database_shard_dsns: List[DatabaseDsn] = Field([], env="DATABASE_SHARD_URLS")
+    database_shard_prefix: str = "shard"
+    database_shard_vnodes: int = 64
+    email_dsn: Optional[EmailDsn] = Field(env="EMAIL_URL")
+    session_dsn: Optional[SessionDsn] = Field(env="SESSION_URL")
+
+    # Logging shortcuts, which are applied to the LOGGING setting.
+    log_level: Optional[LogLevel] = None
+    log_levels: Dict[str, LogLevel] = {}
+    log_queue: bool = False
+    log_queue_size: int = LogQueueModel.__fields__["maxsize"].default
+    log_queue_overflow: Literal["drop", "drop_oldest", "block"] = "drop"
+
+    # Inject a fingerprint of the settings (or of cache_fingerprint_settings) and of
+    # code_version into the KEY_PREFIX or VERSION of every cache, see fingerprint().
+    cache_fingerprint: Optional[Literal["KEY_PREFIX", "VERSION"]] = None
+    cache_fingerprint_settings: Optional[List[str]] = None
+    code_version: Optional[str] = None
+
+    # The inputs the settings were validated from (after merging the environment and
+    # init arguments into them), the init arguments, and the validated field values
+    # before the root validators ran, see derive().
+    _inputs: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _init_fields: Set[str] = PrivateAttr(default_factory=set)
+    _field_values: Dict[str, Any] = PrivateAttr(default_factory=dict)
 
     class Config:
         env_prefix = "DJANGO_"
 
+    def __init__(__pydantic_self__, **values: Any) -> None:
+        state: Dict[str, Any] = {}
+        token = _validation_state.set(state)
+        try:
+            super().__init__(**values)
+        finally:
+            _validation_state.reset(token)
+        __pydantic_self__._set_validation_state(
+            state, {name for name in values if not name.startswith("_")}
+        )
+        __pydantic_self__._set_cache_fingerprint()
+
+    def _build_values(
+        self, init_kwargs: Dict[str, Any], **kwargs: Any
+    ) -> Dict[str, Any]:
+        inputs = super()._build_values(init_kwargs, **kwargs)
+        state = _validation_state.get()
+        if state is not None:
+            state["inputs"] = inputs
+        return inputs
+
+    def _set_validation_state(
+        self, state: Dict[str, Any], init_fields: Set[str]
+    ) -> None:
+        self._inputs = state.get("inputs", {})
+        self._init_fields = init_fields
+        self._field_values = state.get("field_values", {})
+
+    def derive(
+        self, env: Optional[Mapping[str, str]] = None, **fields: Any
+    ) -> "PydanticSettings":
+        """
+        Return new settings validated from the inputs of these settings, with the
+        environment variables in `env` and the given fields changed::
+
+            canary = settings.derive({"DJANGO_DEBUG": "true"}, ALLOWED_HOSTS=["*"])
+
+        Only the changed fields are validated again, the other field values are
+        shared with these settings. The root validators are all run again, since they
+        combine fields (e.g. DATABASE_URL into DATABASES); they are cheap compared to
+        validating every field. Like for the settings class itself, fields take
+        precedence over environment variables.
+        """
+        cls = self.__class__
+        extra = [name for name in fields if name not in cls.__fields__]
+        if extra:
+            raise ValidationError(
+                [ErrorWrapper(ExtraError(), loc=name) for name in extra], cls
+            )
+        init_fields = self._init_fields | set(fields)
+        inputs = dict(self._inputs)
+        changed = set(fields)
+        for name, value in cls._env_inputs(env or {}).items():
+            if name not in init_fields:
+                inputs[name] = value
+                changed.add(name)
+        inputs.update(fields)
+
+        state: Dict[str, Any] = {"inputs": inputs}
+        token = _validation_state.set(state)
+        try:
+            if self._field_values and not cls.__pre_root_validators__:
+                values, fields_set, error = self._revalidate(inputs, changed)
+            else:
+                values, fields_set, error = validate_model(cls, inputs)
+        finally:
+            _validation_state.reset(token)
+        if error:
+            raise error
+
+        settings_obj = cls.__new__(cls)
+        object.__setattr__(settings_obj, "__dict__", values)
+        object.__setattr__(settings_obj, "__fields_set__", fields_set)
+        settings_obj._init_private_attributes()
+        settings_obj._set_validation_state(state, init_fields)
+        settings_obj._set_cache_fingerprint()
+        return settings_obj
+
+    def fingerprint(self, names: Optional[Iterable[str]] = None) -> str:
+        """
+        Return a stable hash of the settings (the settings named by `names`, or by
+        cache_fingerprint_settings, if given) and of code_version. Secrets are left
+        out.
+        """
+        return settings_fingerprint(
+            self.__dict__,
+            names if names is not None else self.cache_fingerprint_settings,
+            self.code_version,
+        )
+
+    def _set_cache_fingerprint(self) -> None:
+        """
+        Inject the settings fingerprint into the KEY_PREFIX or VERSION of every cache,
+        so that deploys whose settings or code version changed read and write a fresh
+        set of keys, while others keep using the same keys.
+
+        This is done after validation rather than by a root validator, so that the
+        fingerprint covers the changes made by the root validators of subclasses.
+        """
+        caches = self.__dict__.get("CACHES")
+        if not self.cache_fingerprint or not caches:
+            return
+        fingerprint = self.fingerprint()
+        if self.cache_fingerprint == "KEY_PREFIX":
+            caches = {
+                alias: cache.copy(
+                    update={
+                        "KEY_PREFIX": f"{cache.KEY_PREFIX}:{fingerprint}"
+                        if cache.KEY_PREFIX
+                        else fingerprint
+                    }
+                )
+                for alias, cache in caches.items()
+            }
+        else:
+            # Cache versions are integers.
+            version = int(fingerprint[:8], 16)
+            caches = {
+                alias: cache.copy(update={"VERSION": version})
+                for alias, cache in caches.items()
+            }
+        self.__dict__["CACHES"] = caches
+
+    def _revalidate(
+        self, inputs: Dict[str, Any], changed: Set[str]
+    ) -> Tuple[Dict[str, Any], Set[str], Optional[ValidationError]]:
+        """
+        Like pydantic's validate_model(), but only validating the changed fields.
+        """
+        cls = self.__class__
+        values = _copy_field_values(self._field_values)
+        errors: List[Any] = []
+        for name in changed:
+            field = cls.__fields__[name]
+            value, error = field.validate(
+                inputs[field.alias], values, loc=field.alias, cls=cls
+            )
+            if isinstance(error, ErrorWrapper):
+                errors.append(error)
+            elif isinstance(error, list):
+                errors.extend(error)
+            else:
+                values[name] = value
+        for skip_on_failure, root_validator_ in cls.__post_root_validators__:
+            if skip_on_failure and errors:
+                continue
+            try:
+                values = root_validator_(cls, values)
+            except (ValueError, TypeError, AssertionError) as exc:
+                errors.append(ErrorWrapper(exc, loc=ROOT_KEY))
+        fields_set = {
+            name for name, field in cls.__fields__.items() if field.alias in inputs
+        }
+        return values, fields_set, ValidationError(errors, cls) if errors else None
+
+    @classmethod
+    def _env_inputs(cls, env: Mapping[str, str]) -> Dict[str, Any]:
+        """
+        Return the inputs of the fields set by the environment variables in `env`,
+        decoding the JSON of complex fields like BaseSettings does.
+        """
+        if not cls.__config__.case_sensitive:
+            env = {key.lower(): value for key, value in env.items()}
+        source = EnvSettingsSource(env_file=None, env_file_encoding=None)
+        inputs = {}
+        for field in cls.__fields__.values():
+            env_name = next(
+                (name for name in field.field_info.extra["env_names"] if name in env),
+                None,
+            )
+            if env_name is None:
+                continue
+            value: Any = env[env_name]
+            is_complex, allow_parse_failure = source.field_is_complex(field)
+            if is_complex:
+                try:
+                    value = cls.__config__.parse_env_var(field.name, value)
+                except ValueError as exc:
+                    if not allow_parse_failure:
+                        raise SettingsError(
+                            f'error parsing env var "{env_name}"'
+                        ) from exc
+            inputs[field.alias] = value
+        return inputs
+
+    @validator("LOGGING", pre=True)
+    def empty_logging(cls, logging: Optional[dict]) -> Optional[dict]:
+        """
+        Django skips configuring logging for an empty LOGGING setting, so don't turn
+        it into a default configuration.
+        """
+        return logging or None
+
+    @validator("log_level", "log_levels", pre=True)
+    def upper_log_levels(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return value.upper()
+        if isinstance(value, dict):
+            return {
+                name: level.upper() if isinstance(level, str) else level
+                for name, level in value.items()
+            }
+        return value
+
     @validator("DATABASES", pre=True)
     def parse_databases(cls, databases: dict) -> dict:
         """
@@ -352,6 +800,17 @@ class PydanticSettings(BaseSettings):
                 parsed_databases[key] = value
         return parsed_databases
 
+    @root_validator(skip_on_failure=True)
+    def save_field_values(cls, values: dict) -> dict:
+        """
+        Keep the validated field values for derive(), before the other root
+        validators combine and update them.
+        """
+        state = _validation_state.get()
+        if state is not None:
+            state["field_values"] = _copy_field_values(values)
+        return values
+
     @root_validator
     def set_default_database(cls, values: dict) -> dict:
         """
@@ -367,6 +826,35 @@ class PydanticSettings(BaseSettings):
             del values[attr]
         return values
 
+    @root_validator
+    def set_database_shards(cls, values: dict) -> dict:
+        """
+        Add the databases of database_shard_dsns to DATABASES, and a ShardRouter for
+        them to DATABASE_ROUTERS.
+        """
+        shard_dsns: List[DatabaseDsn] = values.pop("database_shard_dsns", None) or []
+        prefix = values.pop("database_shard_prefix", None)
+        vnodes = values.pop("database_shard_vnodes", None)
+        if not shard_dsns:
+            return values
+
+        shards = {f"{prefix}{index}": dsn for index, dsn in enumerate(shard_dsns)}
+        conflicts = set(shards) & set(values["DATABASES"])
+        if conflicts:
+            raise ValueError(
+                f"shard aliases {', '.join(sorted(conflicts))} are already configured "
+                "in DATABASES"
+            )
+        values["DATABASES"] = {
+            **values["DATABASES"],
+            **{alias: dsn.to_settings_model() for alias, dsn in shards.items()},
+        }
+        values["DATABASE_ROUTERS"] = [
+            *(values.get("DATABASE_ROUTERS") or []),
+            ShardRouter(list(shards), vnodes),
+        ]
+        return values
+
     @root_validator
     def set_default_cache(cls, values: dict) -> dict:
         """
@@ -382,6 +870,40 @@ class PydanticSettings(BaseSettings):
             del values[attr]
         return values
 
+    @root_validator
+    def set_email(cls, values: dict) -> dict:
+        """
+        Set the EMAIL_* settings provided by the email_dsn field.
+        """
+        email_dsn: Optional[EmailDsn] = values.pop("email_dsn", None)
+        if email_dsn:
+            values.update(email_dsn.to_settings_model().dict(exclude_unset=True))
+        return values
+
+    @root_validator
+    def set_session(cls, values: dict) -> dict:
+        """
+        Set the SESSION_* settings provided by the session_dsn field, adding the
+        session cache it defines to CACHES.
+        """
+        session_dsn: Optional[SessionDsn] = values.pop("session_dsn", None)
+        if not session_dsn:
+            return values
+        session = session_dsn.to_settings_model()
+        CACHES = values.get("CACHES") or {}
+        alias = session.SESSION_CACHE_ALIAS
+        if session.CACHE:
+            if alias in CACHES and CACHES[alias] != session.CACHE:
+                raise ValueError(
+                    f"SESSION_URL cache alias {alias!r} is already configured in "
+                    "CACHES"
+                )
+            values["CACHES"] = {**CACHES, alias: session.CACHE}
+        elif alias and alias not in CACHES:
+            raise ValueError(f"SESSION_URL cache alias {alias!r} isn't configured")
+        values.update(session.dict(exclude={"CACHE"}, exclude_unset=True))
+        return values
+
     @classmethod
     def _get_dsn_fields(cls, field_extra: str) -> Iterable[Tuple[str, str]]:
         field: ModelField
@@ -420,3 +942,63 @@ class PydanticSettings(BaseSettings):
             values["BASE_DIR"] = path.parents[ancestor]
 
         return values
+
+    @root_validator
+    def configure_logging(cls, values: dict) -> dict:
+        """
+        Apply the log_level, log_levels and log_queue shortcuts to the LOGGING
+        setting, and use the queue aware LOGGING_CONFIG function when logging is
+        configured with a queue.
+        """
+        logging: Optional[LoggingModel] = values.get("LOGGING")
+        log_level, log_levels = values.get("log_level"), values.get("log_levels")
+        if log_level or log_levels or values.get("log_queue"):
+            logging = logging or LoggingModel(disable_existing_loggers=False)
+            updates: Dict[str, Any] = {}
+            if log_level:
+                root = dict(logging.root or {}, level=log_level)
+                if not root.get("handlers"):
+                    updates["handlers"] = {
+                        "console": {"class": "logging.StreamHandler"},
+                        **logging.handlers,
+                    }
+                    root["handlers"] = ["console"]
+                updates["root"] = root
+            if log_levels:
+                updates["loggers"] = {
+                    **logging.loggers,
+                    **{
+                        name: dict(logging.loggers.get(name, {}), level=level)
+                        for name, level in log_levels.items()
+                    },
+                }
+            if values.get("log_queue"):
+                updates["queue"] = LogQueueModel(
+                    maxsize=values["log_queue_size"],
+                    overflow=values["log_queue_overflow"],
+                )
+            logging = values["LOGGING"] = logging.copy(update=updates)
+
+        if (
+            logging
+            and logging.queue
+            and values.get("LOGGING_CONFIG") == global_settings.LOGGING_CONFIG
+        ):
+            values["LOGGING_CONFIG"] = "pydantic_settings.log.configure_logging"
+        elif not logging:
+            values["LOGGING"] = global_settings.LOGGING
+        return values
+
+    @root_validator
+    def check_cache_middleware_policies(cls, values: dict) -> dict:
+        """
+        Check that the caches of CACHE_MIDDLEWARE_POLICIES are configured.
+        """
+        caches = values.get("CACHES") or {}
+        for policy in values.get("CACHE_MIDDLEWARE_POLICIES") or []:
+            if policy.seconds and policy.alias not in caches:
+                raise ValueError(
+                    f"cache alias {policy.alias!r} of the {policy.path!r} cache "
+                    "middleware policy isn't configured"
+                )
+        return values
@@ -0,0 +1,140 @@
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple, Type
+
+from django.conf import settings
+
+from pydantic_settings.settings import PydanticSettings
+
+# Settings that hold a mapping of aliases; a tenant overlay for one of these adds to
+# (or replaces individual aliases of) the base settings instead of replacing it.
+MERGED_SETTINGS = ("DATABASES", "CACHES")
+
+# The active tenant and its validated overlay.
+_active: ContextVar[Optional[Tuple[str, Dict[str, Any]]]] = ContextVar(
+    "pydantic_settings_tenant", default=None
+)
+
+
+class TenantSettingsProxy:
+    """
+    Read-only view of the Django settings with the overlay of the tenant that is
+    active in the current context applied on top.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        active = _active.get()
+        if active is not None and name in active[1]:
+            return active[1][name]
+        return getattr(settings, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("tenant settings are read-only")
+
+
+tenant_settings = TenantSettingsProxy()
+
+
+def active_tenant() -> Optional[str]:
+    """Return the tenant that is active in the current context, if any."""
+    active = _active.get()
+    return active[0] if active is not None else None
+
+
+class TenantSettings:
+    """
+    Validated per-tenant settings overlays.
+
+    Static overlays are validated once, when the `TenantSettings` is created, so
+    misconfigured tenants fail at startup. Tenants that aren't known up front can be
+    provided by a `loader` callable, whose overlays are validated on first use and
+    kept in an LRU cache of `maxsize` tenants.
+
+    Activating a tenant only sets a context variable, so it is local to the current
+    thread or asyncio task and never touches the global Django settings. Settings read
+    through `tenant_settings` (or `TenantSettings.settings`) see the active tenant's
+    overlay, falling back to the Django settings for everything else.
+
+    The DATABASES and CACHES aliases of overlays are settings only: Django's
+    connection handlers (`django.db.connections`, `django.core.cache.caches`) only
+    know the aliases of the Django settings.
+    """
+
+    settings = tenant_settings
+
+    def __init__(
+        self,
+        settings_class: Type[PydanticSettings],
+        overlays: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        loader: Optional[Callable[[str], Optional[Mapping[str, Any]]]] = None,
+        maxsize: Optional[int] = 128,
+    ):
+        self.settings_class = settings_class
+        self.loader = loader
+        self._base: Optional[PydanticSettings] = None
+        self._overlays: Dict[str, Dict[str, Any]] = {
+            tenant: self.validate(overlay)
+            for tenant, overlay in (overlays or {}).items()
+        }
+        self._load = lru_cache(maxsize=maxsize)(self._load_uncached)
+
+    @property
+    def base(self) -> PydanticSettings:
+        if self._base is None:
+            self._base = self.settings_class()
+        return self._base
+
+    def validate(self, overlay: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Validate an overlay against the settings class, returning the settings it
+        changes in the form Django expects them.
+        """
+        overlay = dict(overlay)
+        fields = dict(overlay)
+        # The cache DSN fields (e.g. CACHE_URL) replace their CACHES alias, so they
+        # are cleared for the aliases the overlay sets itself.
+        for alias, name in self.settings_class._get_dsn_fields("configure_cache"):
+            if alias in (overlay.get("CACHES") or {}) and name not in overlay:
+                fields[name] = None
+        for key in MERGED_SETTINGS:
+            if key in overlay:
+                fields[key] = {**getattr(self.base, key), **overlay[key]}
+        # Only the fields of the overlay need to be validated again.
+        settings_obj = self.base.derive(**fields)
+        return settings_obj.dict(include=set(overlay))
+
+    def _load_uncached(self, tenant: str) -> Dict[str, Any]:
+        overlay = self.loader(tenant) if self.loader else None
+        if overlay is None:
+            raise LookupError(f"unknown tenant {tenant!r}")
+        return self.validate(overlay)
+
+    def get(self, tenant: str) -> Dict[str, Any]:
+        """Return the validated overlay of a tenant."""
+        overlay = self._overlays.get(tenant)
+        if overlay is None:
+            overlay = self._load(tenant)
+        return overlay
+
+    def activate(self, tenant: str) -> Token:
+        """
+        Activate a tenant for the current context, returning a token to pass to
+        `deactivate()`.
+        """
+        return _active.set((tenant, self.get(tenant)))
+
+    def deactivate(self, token: Token) -> None:
+        """Restore the tenant that was active before the matching `activate()`."""
+        _active.reset(token)
+
+    @contextmanager
+    def override(self, tenant: str) -> Iterator[None]:
+        """Activate a tenant for the duration of a `with` block."""
+        token = self.activate(tenant)
+        try:
+            yield
+        finally:
+            self.deactivate(token)
@@ -0,0 +1,131 @@
+"""
+Translation of the TIMEOUTS of database and cache settings (in seconds) into the
+OPTIONS of their engines and backends.
+"""
+
+import math
+import re
+from typing import Any, Dict, Optional
+
+# PostgreSQL settings of the statement, lock and idle in transaction timeouts, which
+# are set for the session with `-c` command-line options.
+POSTGRES_TIMEOUT_SETTINGS = {
+    "statement": "statement_timeout",
+    "lock": "lock_timeout",
+    "idle_in_transaction": "idle_in_transaction_session_timeout",
+}
+MYSQL_LOCK_TIMEOUT_COMMAND = "SET SESSION innodb_lock_wait_timeout="
+
+BUILTIN_REDIS_BACKENDS = (
+    "django.core.cache.backends.redis.RedisCache",
+    "pydantic_settings.backends.redis.RedisSentinelCache",
+    "pydantic_settings.backends.redis.RedisClusterCache",
+)
+REDIS_BACKENDS = ("django_redis.cache.RedisCache", "redis_cache.RedisCache")
+PYMEMCACHE_BACKEND = "django.core.cache.backends.memcached.PyMemcacheCache"
+PYLIBMC_BACKEND = "django.core.cache.backends.memcached.PyLibMCCache"
+
+
+def _milliseconds(seconds: float) -> int:
+    return round(seconds * 1000)
+
+
+def _whole_seconds(seconds: float, minimum: int = 1) -> int:
+    return max(minimum, math.ceil(seconds))
+
+
+def _set_timeouts(timeouts: Dict[str, Optional[float]]) -> Dict[str, float]:
+    return {name: value for name, value in timeouts.items() if value is not None}
+
+
+def database_options(
+    engine: str, options: Dict[str, Any], timeouts: Dict[str, Optional[float]]
+) -> Dict[str, Any]:
+    """
+    Return a copy of the OPTIONS of a database with its timeouts applied. Applying
+    the same timeouts again doesn't change the options.
+    """
+    timeouts = _set_timeouts(timeouts)
+    if not timeouts:
+        return options
+    options = dict(options)
+
+    if "postgresql" in engine or "postgis" in engine:
+        if "connect" in timeouts:
+            # libpq only supports whole seconds, and treats less than 2 as 2.
+            options["connect_timeout"] = _whole_seconds(timeouts.pop("connect"), 2)
+        parameters = options.get("options", "")
+        for name, setting in POSTGRES_TIMEOUT_SETTINGS.items():
+            if name in timeouts:
+                parameters = re.sub(rf"\s*-c\s*{setting}=\S*", "", parameters)
+                parameters += f" -c {setting}={_milliseconds(timeouts.pop(name))}"
+        if parameters:
+            options["options"] = parameters.strip()
+    elif "mysql" in engine:
+        if "connect" in timeouts:
+            options["connect_timeout"] = _whole_seconds(timeouts.pop("connect"))
+        if "statement" in timeouts:
+            options["read_timeout"] = _whole_seconds(timeouts.pop("statement"))
+        if "lock" in timeouts:
+            # Replace the lock timeout of a previous application, keeping any other
+            # commands, e.g. SET sql_mode=...
+            commands = [
+                command
+                for command in (options.get("init_command") or "").split(";")
+                if command.strip()
+                and not command.strip().startswith(MYSQL_LOCK_TIMEOUT_COMMAND)
+            ]
+            commands.append(
+                MYSQL_LOCK_TIMEOUT_COMMAND + str(_whole_seconds(timeouts.pop("lock")))
+            )
+            options["init_command"] = "; ".join(command.strip() for command in commands)
+    elif "sqlite" in engine or "spatialite" in engine:
+        if "lock" in timeouts:
+            lock = timeouts.pop("lock")
+            if options.get("timeout") not in (None, lock):
+                raise ValueError(
+                    "the lock timeout can't be combined with a different timeout "
+                    "(or busy_timeout) option"
+                )
+            options["timeout"] = lock
+
+    if timeouts:
+        raise ValueError(f"{', '.join(timeouts)} timeouts aren't supported by {engine}")
+    return options
+
+
+def cache_options(
+    backend: str, options: Dict[str, Any], timeouts: Dict[str, Optional[float]]
+) -> Dict[str, Any]:
+    """
+    Return a copy of the OPTIONS of a cache with its socket timeouts applied.
+    Applying the same timeouts again doesn't change the options.
+    """
+    timeouts = _set_timeouts(timeouts)
+    if not timeouts:
+        return options
+    options = dict(options)
+    connect, read = timeouts.get("connect"), timeouts.get("read")
+
+    if backend in BUILTIN_REDIS_BACKENDS:
+        names = ("socket_connect_timeout", "socket_timeout")
+    elif backend in REDIS_BACKENDS:
+        names = ("SOCKET_CONNECT_TIMEOUT", "SOCKET_TIMEOUT")
+    elif backend == PYMEMCACHE_BACKEND:
+        names = ("connect_timeout", "timeout")
+    elif backend == PYLIBMC_BACKEND:
+        # pylibmc behaviors, in milliseconds and microseconds.
+        behaviors = dict(options.get("behaviors") or {})
+        if connect is not None:
+            behaviors["connect_timeout"] = _milliseconds(connect)
+        if read is not None:
+            behaviors["receive_timeout"] = round(read * 1_000_000)
+        options["behaviors"] = behaviors
+        return options
+    else:
+        raise ValueError(f"socket timeouts aren't supported by {backend}")
+
+    for name, value in zip(names, (connect, read)):
+        if value is not None:
+            options[name] = value
+    return options
@@ -0,0 +1,122 @@
+"""
+Connection warm-up.
+
+`warm_up()` opens a connection to every alias of DATABASES and CACHES concurrently,
+so that the first requests served by a worker don't pay for connection and TLS
+setup. Call it in each worker process, after it has been forked, from the thread
+that serves requests, e.g. from a gunicorn `post_worker_init` hook or a uWSGI
+`@postfork` function. Connections opened before forking would be shared by every
+worker.
+
+Django keeps database connections and cache clients per thread, so the connection
+objects are looked up in the calling thread and only connected in the thread pool:
+the connections that are opened are the ones the calling thread goes on to use.
+`warm_up()` waits for every connection attempt to finish, so no thread touches the
+connections once it returns; the attempts are bounded by the connect timeouts of
+the drivers, set by the `connect` timeout of TIMEOUTS. The result of the warm-up is
+reported per alias rather than raised.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches as cache_handler
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+DUMMY_DATABASE_ENGINE = "django.db.backends.dummy"
+WARMUP_CACHE_KEY = "pydantic_settings.warmup"
+
+_last_report: Optional[Dict[str, Any]] = None
+
+
+def _database_tasks(
+    aliases: Optional[Iterable[str]],
+) -> List[Tuple[str, Callable[[], Any]]]:
+    if aliases is None:
+        aliases = [
+            alias
+            for alias, config in settings.DATABASES.items()
+            if config.get("ENGINE") != DUMMY_DATABASE_ENGINE
+        ]
+    return [(alias, connections[alias].ensure_connection) for alias in aliases]
+
+
+def _cache_tasks(
+    aliases: Optional[Iterable[str]],
+) -> List[Tuple[str, Callable[[], Any]]]:
+    if aliases is None:
+        aliases = list(settings.CACHES)
+    # Reading a key is the cheapest operation that makes every backend connect.
+    return [
+        (alias, lambda cache=cache_handler[alias]: cache.get(WARMUP_CACHE_KEY))
+        for alias in aliases
+    ]
+
+
+def _timed(task: Callable[[], Any]) -> Tuple[float, Optional[BaseException]]:
+    # Report the time the task finished at, rather than the time its result is
+    # collected.
+    try:
+        task()
+    except Exception as exc:
+        return time.monotonic(), exc
+    return time.monotonic(), None
+
+
+def warm_up(
+    databases: Optional[Iterable[str]] = None,
+    caches: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Connect to the given database and cache aliases (all of them by default)
+    concurrently, and return whether each of them is ready::
+
+        {
+            "ready": False,
+            "databases": {"default": {"ready": True, "seconds": 0.02, "error": None}},
+            "caches": {"default": {"ready": False, "seconds": 0.5, "error": "..."}},
+        }
+
+    Waits for every alias to connect or fail, so aliases should have a connect
+    timeout.
+    """
+    global _last_report
+
+    tasks = {
+        "databases": _database_tasks(databases),
+        "caches": _cache_tasks(caches),
+    }
+    report: Dict[str, Any] = {"ready": True, "databases": {}, "caches": {}}
+    count = sum(len(kind_tasks) for kind_tasks in tasks.values())
+    if count:
+        start = time.monotonic()
+        with ThreadPoolExecutor(count, thread_name_prefix="warmup") as executor:
+            futures = [
+                (kind, alias, executor.submit(_timed, task))
+                for kind, kind_tasks in tasks.items()
+                for alias, task in kind_tasks
+            ]
+        for kind, alias, future in futures:
+            end, exc = future.result()
+            error = None if exc is None else f"{exc.__class__.__name__}: {exc}"
+            report[kind][alias] = {
+                "ready": error is None,
+                "seconds": round(end - start, 6),
+                "error": error,
+            }
+            if error is not None:
+                report["ready"] = False
+                logger.warning("Warming up %s %r failed: %s", kind, alias, error)
+
+    _last_report = report
+    return report
+
+
+def last_report() -> Optional[Dict[str, Any]]:
+    """Return the report of the last warm-up, if any, e.g. for a readiness probe."""
+    return _last_report
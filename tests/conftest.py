@@ -0,0 +1,86 @@
+import socketserver
+import threading
+
+import pytest
+from asgiref.local import Local
+from django.core.cache import caches
+from django.db import connections
+
+from pydantic_settings.backends import smtp
+
+pytest_plugins = ["pydantic_settings.pytest_plugin"]
+
+
+def _reset_connections():
+    # The connection handlers cache the DATABASES and CACHES settings.
+    for handler in (connections, caches):
+        for alias in handler.__dict__.pop("settings", None) or {}:
+            connection = getattr(handler._connections, alias, None)
+            if connection is not None:
+                connection.close()
+        handler._settings = None
+        handler._connections = Local(handler.thread_critical)
+
+
+@pytest.fixture()
+def reset_connections():
+    _reset_connections()
+    yield
+    _reset_connections()
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply("220 localhost")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.split()[0].upper() if line.strip() else b""
+            if command == b"QUIT":
+                self.reply("221 bye")
+                return
+            if command == b"DATA":
+                self.reply("354 go ahead")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                server.messages += 1
+                self.reply("250 ok")
+                if server.drop_after_message:
+                    return
+            else:
+                self.reply("250 ok")
+
+
+@pytest.fixture()
+def smtp_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SMTPHandler)
+    server.daemon_threads = True
+    server.connections = server.messages = 0
+    server.drop_after_message = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    smtp.close_pools()
+    smtp._pools.clear()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def silent_server():
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            self.request.recv(1)
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield "%s:%s" % server.server_address
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,99 @@
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from pydantic import ValidationError
+
+from pydantic_settings import PydanticSettings
+from pydantic_settings.cache_policies import CachePolicyMiddleware, compile_policies
+from pydantic_settings.models import CachePolicyModel
+
+
+def test_compile_policies():
+    match = compile_policies(
+        [
+            CachePolicyModel(path="/static/", seconds=3600),
+            CachePolicyModel(path=r"^/items/\d+/$", seconds=60),
+            CachePolicyModel(path="/items/"),
+        ]
+    )
+
+    assert match("/static/app.css") == 0
+    assert match("/items/42/") == 1
+    assert match("/items/42/edit/") == 2
+    assert match("/about/") is None
+    assert compile_policies([])("/") is None
+
+
+def test_compile_regex_policies():
+    # Groups with the same name or backreferences only work in separate regexes.
+    match = compile_policies(
+        [
+            CachePolicyModel(path=r"^/a/(?P<id>\d+)/$"),
+            CachePolicyModel(path="/a/"),
+            CachePolicyModel(path=r"^/b/(?P<id>\d+)/$"),
+            CachePolicyModel(path=r"^/(c)/\1/$"),
+            CachePolicyModel(path="/"),
+        ]
+    )
+
+    assert match("/a/1/") == 0
+    assert match("/a/b/") == 1
+    assert match("/b/2/") == 2
+    assert match("/c/c/") == 3
+    assert match("/c/d/") == 4
+
+
+def test_cache_policy_middleware(configure_settings, reset_connections):
+    configure_settings(
+        ALLOWED_HOSTS=["testserver"],
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "pages": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "pages",
+            },
+        },
+        CACHE_MIDDLEWARE_POLICIES=[
+            {"path": "/blog/", "seconds": 60, "alias": "pages", "vary": ["Accept"]},
+            {"path": "/blog/drafts/", "seconds": 600},
+            {"path": "^/$", "seconds": 0},
+        ],
+    )
+    calls = []
+
+    def view(request):
+        calls.append(request.path)
+        return HttpResponse(f"response {len(calls)}")
+
+    middleware = CachePolicyMiddleware(view)
+    factory = RequestFactory()
+
+    def get(path, **headers):
+        return middleware(factory.get(path, **headers)).content
+
+    assert get("/blog/post/") == get("/blog/post/") == b"response 1"
+    # The first matching policy wins, and responses vary on the Accept header.
+    assert get("/blog/drafts/", HTTP_ACCEPT="text/html") == b"response 2"
+    assert get("/blog/drafts/", HTTP_ACCEPT="text/html") == b"response 2"
+    assert get("/blog/drafts/", HTTP_ACCEPT="application/json") == b"response 3"
+    response = middleware(factory.get("/blog/post/"))
+    assert response["Vary"] == "Accept"
+    assert response["Cache-Control"] == "max-age=60"
+    # Paths matching a policy without seconds, or no policy at all, aren't cached.
+    assert get("/") == b"response 4"
+    assert get("/") == b"response 5"
+    assert get("/about/") == b"response 6"
+    assert get("/about/") == b"response 7"
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        {"path": "/blog/", "seconds": 60, "alias": "pages"},
+        {"path": "^/blog/(", "seconds": 60},
+        {"path": "/blog/", "seconds": -1},
+    ],
+)
+def test_invalid_cache_policies(policy):
+    with pytest.raises(ValidationError):
+        PydanticSettings(CACHE_MIDDLEWARE_POLICIES=[policy])
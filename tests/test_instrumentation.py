@@ -0,0 +1,94 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from django.conf import LazySettings, settings
+
+from pydantic_settings import SetUp, instrumentation
+
+
+@pytest.fixture()
+def instrumented(configure_settings):
+    configure_settings()
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_count_reads(instrumented):
+    for _ in range(3):
+        settings.DEBUG
+    settings.configured
+
+    snapshot = instrumentation.snapshot()
+    assert snapshot["reads"] == {"DEBUG": 3}
+    assert "DEBUG" not in snapshot["unread"]
+    assert "TIME_ZONE" in snapshot["unread"]
+
+
+def test_thread_reads(instrumented):
+    def read_settings():
+        for _ in range(1000):
+            settings.DEBUG
+        settings.USE_TZ
+
+    threads = [threading.Thread(target=read_settings) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    # Snapshots can be taken while other threads read settings.
+    while any(thread.is_alive() for thread in threads):
+        instrumentation.snapshot()
+    for thread in threads:
+        thread.join()
+
+    assert instrumentation.snapshot()["reads"] == {"DEBUG": 4000, "USE_TZ": 4}
+
+    # The counts of threads that exited are folded together.
+    settings.DEBUG
+    assert len(instrumentation._thread_counts) == 1
+
+
+def test_disabled(instrumented):
+    instrumentation.disable()
+    settings.DEBUG
+
+    assert type(settings) is LazySettings
+    assert instrumentation.snapshot()["reads"] == {}
+
+
+def test_track(instrumented):
+    settings.DEBUG
+    for _ in range(2):
+        with instrumentation.track("task"):
+            settings.TIME_ZONE
+
+    snapshot = instrumentation.snapshot()
+    assert snapshot["reads"] == {"DEBUG": 1, "TIME_ZONE": 2}
+    assert snapshot["scopes"] == {"task": {"count": 2, "reads": {"TIME_ZONE": 2}}}
+
+
+def test_middleware(instrumented):
+    def view(request):
+        settings.USE_TZ
+        request.resolver_match = SimpleNamespace(route="items/<int:pk>/")
+        return "response"
+
+    middleware = instrumentation.SettingsReadsMiddleware(view)
+    assert middleware(SimpleNamespace(resolver_match=None)) == "response"
+    middleware(SimpleNamespace(resolver_match=None))
+
+    assert instrumentation.snapshot()["scopes"] == {
+        "items/<int:pk>/": {"count": 2, "reads": {"USE_TZ": 2}}
+    }
+
+
+def test_setup_enables_instrumentation(configure_settings, monkeypatch):
+    monkeypatch.setenv("DJANGO_SETTINGS_INSTRUMENT", "true")
+    try:
+        assert SetUp().configure()
+        assert instrumentation.is_enabled()
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
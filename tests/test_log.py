@@ -0,0 +1,155 @@
+import logging
+import os
+import queue
+
+import pytest
+from django.conf import settings
+from django.core import mail
+from django.utils.log import AdminEmailHandler, configure_logging
+
+from pydantic_settings import log
+
+
+class ListHandler(logging.Handler):
+    records = []
+
+    def emit(self, record):
+        self.records.append(record.getMessage())
+
+
+@pytest.fixture()
+def restore_logging():
+    loggers = [logging.getLogger()] + [
+        logger
+        for logger in list(logging.Logger.manager.loggerDict.values())
+        if isinstance(logger, logging.Logger)
+    ]
+    saved = [(logger, logger.handlers[:], logger.level) for logger in loggers]
+    yield
+    log.stop_listeners()
+    for logger, handlers, level in saved:
+        logger.handlers, logger.level = handlers, level
+
+
+def test_logging_settings(configure_settings):
+    configure_settings(
+        {
+            "DJANGO_LOG_LEVEL": "info",
+            "DJANGO_LOG_LEVELS": '{"django.db.backends": "debug"}',
+            "DJANGO_LOG_QUEUE": "true",
+            "DJANGO_LOG_QUEUE_SIZE": "100",
+        }
+    )
+
+    assert settings.LOGGING_CONFIG == "pydantic_settings.log.configure_logging"
+    assert settings.LOGGING["disable_existing_loggers"] is False
+    assert settings.LOGGING["root"] == {"level": "INFO", "handlers": ["console"]}
+    assert settings.LOGGING["handlers"]["console"]["class"] == "logging.StreamHandler"
+    assert settings.LOGGING["loggers"] == {"django.db.backends": {"level": "DEBUG"}}
+    assert settings.LOGGING["queue"] == {"maxsize": 100, "overflow": "drop"}
+
+
+def test_no_logging_settings(configure_settings):
+    configure_settings()
+
+    assert settings.LOGGING == {}
+    assert settings.LOGGING_CONFIG == "logging.config.dictConfig"
+
+
+def test_queued_logging(restore_logging):
+    log.configure_logging(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "handlers": {"list": {"class": "test_log.ListHandler"}},
+            "root": {"handlers": ["list"], "level": "INFO"},
+            "queue": {"maxsize": 100, "overflow": "drop"},
+        }
+    )
+
+    root = logging.getLogger()
+    assert isinstance(root.handlers[0], log.OverflowQueueHandler)
+
+    logging.getLogger("queued").info("hello %s", "world")
+    log.stop_listeners()
+
+    assert ListHandler.records == ["hello world"]
+
+
+def test_queued_django_logging(configure_settings, restore_logging):
+    configure_settings(
+        ADMINS=[("Admin", "admin@example.com")],
+        EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+        # Rendering the error report doesn't need the translations of apps then.
+        USE_I18N=False,
+    )
+    configure_logging(
+        "pydantic_settings.log.configure_logging",
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "queue": {"maxsize": 100, "overflow": "drop"},
+        },
+    )
+
+    # The handlers of Django's default logging configuration are queued too, except
+    # mail_admins, which needs the exception info and the request of records.
+    django_logger = logging.getLogger("django")
+    assert [type(handler) for handler in django_logger.handlers] == [
+        log.OverflowQueueHandler,
+        AdminEmailHandler,
+    ]
+    handlers = {name for stats in log.queue_stats() for name in stats["handlers"]}
+    assert {"console", "django.server"} <= handlers
+    assert "mail_admins" not in handlers
+
+    mail.outbox = []
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logging.getLogger("django.request").exception("Internal Server Error")
+    assert len(mail.outbox) == 1
+    assert "Traceback" in mail.outbox[0].body
+    assert 'raise RuntimeError("boom")' in mail.outbox[0].body
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+def test_queued_logging_after_fork(restore_logging, tmp_path):
+    path = tmp_path / "log.txt"
+    log.configure_logging(
+        {
+            "version": 1,
+            "handlers": {"file": {"class": "logging.FileHandler", "filename": path}},
+            "loggers": {"forked": {"handlers": ["file"], "level": "INFO"}},
+            "queue": {"maxsize": 100, "overflow": "block"},
+        }
+    )
+
+    pid = os.fork()
+    if pid == 0:
+        # The child's records are handled by a listener of its own.
+        logging.getLogger("forked").info("child")
+        log.stop_listeners()
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+    assert path.read_text() == "child\n"
+
+
+@pytest.mark.parametrize(
+    "overflow,expected", [("drop", ["first"]), ("drop_oldest", ["second"])]
+)
+def test_queue_overflow(overflow, expected):
+    records = queue.Queue(1)
+    handler = log.OverflowQueueHandler(records, overflow)
+    logger = logging.getLogger(f"overflow.{overflow}")
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    logger.warning("first")
+    logger.warning("second")
+
+    assert handler.dropped == 1
+    assert [records.get_nowait().getMessage() for _ in range(records.qsize())] == (
+        expected
+    )
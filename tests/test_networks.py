@@ -0,0 +1,45 @@
+from ipaddress import ip_address
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pydantic_settings.networks import IPNetworkSet
+
+
+class Model(BaseModel):
+    ips: IPNetworkSet
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ["10.0.0.0/8", "127.0.0.1", "::1", "fd00::/8"],
+        '["10.0.0.0/8", "127.0.0.1", "::1", "fd00::/8"]',
+        "10.0.0.0/8, 127.0.0.1,::1,fd00::/8",
+    ],
+)
+def test_ip_network_set(value):
+    ips = Model(ips=value).ips
+
+    assert len(ips) == 4
+    assert "10.1.2.3" in ips
+    assert "127.0.0.1" in ips
+    assert ip_address("fd12::1") in ips
+    assert "::1" in ips
+    assert "11.0.0.1" not in ips
+    assert "127.0.0.2" not in ips
+    assert "::2" not in ips
+    assert "not-an-address" not in ips
+
+
+def test_ip_network_set_merges_ranges():
+    ips = IPNetworkSet(["10.0.0.0/25", "10.0.0.128/25", "10.0.0.5", "192.168.0.0/16"])
+
+    assert ips == IPNetworkSet(["10.0.0.0/24", "192.168.0.0/16"])
+    assert "10.0.0.255" in ips
+    assert "10.0.1.0" not in ips
+
+
+def test_ip_network_set_invalid():
+    with pytest.raises(ValidationError):
+        Model(ips=["10.0.0.1/8"])
@@ -0,0 +1,68 @@
+import json
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_settings.routers import HashRing, ShardRouter
+from pydantic_settings.settings import PydanticSettings
+
+
+def instance(db=None, shard_key=None):
+    return SimpleNamespace(_state=SimpleNamespace(db=db), shard_key=shard_key)
+
+
+def test_hash_ring_distribution():
+    ring = HashRing(["shard0", "shard1", "shard2", "shard3"])
+    counts = Counter(ring.get(key) for key in range(10000))
+
+    assert set(counts) == set(ring.nodes)
+    assert min(counts.values()) > 1500
+
+
+def test_hash_ring_adding_node_moves_few_keys():
+    before = HashRing(["shard0", "shard1", "shard2", "shard3"])
+    after = HashRing(["shard0", "shard1", "shard2", "shard3", "shard4"])
+    moved = [key for key in range(10000) if before.get(key) != after.get(key)]
+
+    assert all(after.get(key) == "shard4" for key in moved)
+    assert len(moved) < 3000
+
+
+def test_shard_router():
+    router = ShardRouter(["shard0", "shard1"])
+    shard = router.shard_for("tenant-1")
+
+    assert router.db_for_read(None, shard_key="tenant-1") == shard
+    assert router.db_for_write(None, instance=instance(shard_key="tenant-1")) == shard
+    assert router.db_for_write(None, instance=instance(db="shard1")) == "shard1"
+    assert router.db_for_read(None, instance=instance()) is None
+    assert router.db_for_read(None) is None
+    assert router.allow_relation(instance("shard0"), instance("shard1")) is False
+    assert router.allow_relation(instance("shard0"), instance("shard0")) is True
+    assert router.allow_relation(instance("default"), instance("other")) is None
+
+
+def test_database_shard_urls(monkeypatch):
+    monkeypatch.setenv(
+        "DATABASE_SHARD_URLS",
+        json.dumps(["postgres://db0/app", "postgres://db1/app"]),
+    )
+    monkeypatch.setenv("DJANGO_DATABASE_ROUTERS", '["app.routers.Router"]')
+    settings = PydanticSettings()
+
+    assert settings.DATABASES["shard0"].HOST == "db0"
+    assert settings.DATABASES["shard1"].HOST == "db1"
+    assert settings.DATABASE_ROUTERS == [
+        "app.routers.Router",
+        ShardRouter(["shard0", "shard1"]),
+    ]
+
+
+def test_database_shard_alias_conflict(monkeypatch):
+    monkeypatch.setenv("DATABASE_SHARD_URLS", '["postgres://db0/app"]')
+    monkeypatch.setenv("DJANGO_DATABASE_SHARD_PREFIX", "default")
+    monkeypatch.setenv("DJANGO_DATABASES", '{"default0": "sqlite:///db.sqlite3"}')
+    with pytest.raises(ValidationError, match="already configured"):
+        PydanticSettings()
@@ -0,0 +1,99 @@
+import pytest
+from django.conf import settings
+from pydantic import BaseModel, ValidationError
+
+from pydantic_settings.sessions import SessionDsn
+from pydantic_settings.settings import PydanticSettings
+
+
+class Model(BaseModel):
+    url: SessionDsn
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        (
+            "cached_db+redis://:secret@localhost:6379/2?serializer=json&alias=s",
+            {
+                "SESSION_ENGINE": "django.contrib.sessions.backends.cached_db",
+                "SESSION_CACHE_ALIAS": "s",
+                "SESSION_SERIALIZER": (
+                    "django.contrib.sessions.serializers.JSONSerializer"
+                ),
+                "CACHE": {
+                    "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                    "LOCATION": "redis://secret@localhost:6379/2",
+                },
+            },
+        ),
+        (
+            "cache+locmem://?timeout=600",
+            {
+                "SESSION_ENGINE": "django.contrib.sessions.backends.cache",
+                "SESSION_CACHE_ALIAS": "sessions",
+                "CACHE": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": "",
+                    "TIMEOUT": 600,
+                },
+            },
+        ),
+        (
+            "cache://",
+            {
+                "SESSION_ENGINE": "django.contrib.sessions.backends.cache",
+                "SESSION_CACHE_ALIAS": "default",
+            },
+        ),
+        (
+            "file:///tmp/sessions",
+            {
+                "SESSION_ENGINE": "django.contrib.sessions.backends.file",
+                "SESSION_FILE_PATH": "/tmp/sessions",
+            },
+        ),
+        (
+            "signed_cookies://",
+            {"SESSION_ENGINE": "django.contrib.sessions.backends.signed_cookies"},
+        ),
+    ],
+)
+def test_session_dsn(url, expected):
+    dsn = Model(url=url).url
+    assert dsn.to_settings_model().dict(exclude_unset=True) == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "db://?alias=default",
+        "cache+redis://localhost?serializer=yaml",
+        "redis://localhost",
+    ],
+)
+def test_invalid_session_dsn(url):
+    with pytest.raises(ValidationError):
+        Model(url=url)
+
+
+def test_session_url_setting(configure_settings):
+    configure_settings({"SESSION_URL": "cached_db+redis://localhost/2"})
+
+    assert settings.SESSION_ENGINE == "django.contrib.sessions.backends.cached_db"
+    assert settings.SESSION_CACHE_ALIAS == "sessions"
+    assert settings.CACHES["sessions"]["LOCATION"] == "redis://localhost:6379/2"
+    assert "default" in settings.CACHES
+
+
+def test_session_url_cache_alias_conflict(monkeypatch):
+    monkeypatch.setenv("CACHE_URL", "redis://localhost/1")
+    monkeypatch.setenv("SESSION_URL", "cache+redis://localhost/2?alias=default")
+    with pytest.raises(ValidationError, match="already configured"):
+        PydanticSettings()
+
+
+def test_session_url_missing_cache_alias(monkeypatch):
+    monkeypatch.setenv("SESSION_URL", "cache://?alias=sessions")
+    with pytest.raises(ValidationError, match="isn't configured"):
+        PydanticSettings()
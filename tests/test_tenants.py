@@ -0,0 +1,97 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_settings import PydanticSettings
+from pydantic_settings.tenants import TenantSettings, active_tenant, tenant_settings
+
+DUMMY_CACHE = "django.core.cache.backends.dummy.DummyCache"
+
+
+@pytest.fixture()
+def tenants(configure_settings):
+    configure_settings({"DATABASE_URL": "sqlite:///default.db"})
+    return TenantSettings(
+        PydanticSettings,
+        overlays={
+            "acme": {
+                "DATABASES": {"tenant": "postgres://acme@db.acme.test/acme"},
+                "TIME_ZONE": "Europe/Paris",
+            },
+            "globex": {"TIME_ZONE": "Australia/Sydney"},
+        },
+        loader=lambda tenant: (
+            {"TIME_ZONE": "Asia/Tokyo"} if tenant == "initech" else None
+        ),
+    )
+
+
+def test_tenant_overlay(tenants):
+    assert tenant_settings.TIME_ZONE == "America/Chicago"
+
+    with tenants.override("acme"):
+        assert active_tenant() == "acme"
+        assert tenant_settings.TIME_ZONE == "Europe/Paris"
+        assert tenant_settings.DATABASES["default"]["NAME"] == "default.db"
+        assert tenant_settings.DATABASES["tenant"]["HOST"] == "db.acme.test"
+
+        with tenants.override("globex"):
+            assert tenant_settings.TIME_ZONE == "Australia/Sydney"
+            assert "tenant" not in tenant_settings.DATABASES
+
+        assert active_tenant() == "acme"
+
+    assert active_tenant() is None
+    assert tenant_settings.TIME_ZONE == "America/Chicago"
+
+
+def test_tenant_cache_overlay(configure_settings, monkeypatch):
+    monkeypatch.setenv("CACHE_URL", "locmem://base")
+    tenants = TenantSettings(
+        PydanticSettings,
+        overlays={"acme": {"CACHES": {"default": {"BACKEND": DUMMY_CACHE}}}},
+    )
+
+    # The environment's cache DSN doesn't replace the overlay's default cache.
+    with tenants.override("acme"):
+        assert tenant_settings.CACHES["default"]["BACKEND"].endswith("DummyCache")
+
+
+def test_tenant_loader(tenants):
+    with tenants.override("initech"):
+        assert tenant_settings.TIME_ZONE == "Asia/Tokyo"
+    assert tenants.get("initech") is tenants.get("initech")
+
+    with pytest.raises(LookupError):
+        tenants.activate("umbrella")
+
+
+def test_tenant_isolation(tenants):
+    def in_thread(tenant):
+        with tenants.override(tenant):
+            return tenant_settings.TIME_ZONE
+
+    async def in_task(tenant):
+        with tenants.override(tenant):
+            await asyncio.sleep(0)
+            return tenant_settings.TIME_ZONE
+
+    async def in_tasks():
+        return await asyncio.gather(in_task("acme"), in_task("initech"))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(in_thread, ["acme", "initech"])) == [
+            "Europe/Paris",
+            "Asia/Tokyo",
+        ]
+    assert asyncio.run(in_tasks()) == ["Europe/Paris", "Asia/Tokyo"]
+    assert active_tenant() is None
+
+
+def test_invalid_tenant_overlay(configure_settings):
+    configure_settings()
+
+    with pytest.raises(ValidationError):
+        TenantSettings(PydanticSettings, overlays={"acme": {"DEBUG": "maybe"}})
@@ -0,0 +1,84 @@
+import socket
+import threading
+
+import pytest
+from django.core.cache.backends.base import BaseCache
+from django.db import connections
+
+from pydantic_settings import SetUp, warmup
+
+
+class SocketCache(BaseCache):
+    """A cache that reads every key from a server, with a read timeout."""
+
+    def __init__(self, server, params):
+        super().__init__(params)
+        self.address = server.split(":")
+        self.timeout = params["OPTIONS"]["timeout"]
+
+    def get(self, key, default=None, version=None):
+        with socket.create_connection(self.address, timeout=self.timeout) as sock:
+            sock.recv(1)
+        return default
+
+
+def test_warm_up(configure_settings, reset_connections, tmp_path):
+    configure_settings(
+        {"CACHE_URL": f"file://{tmp_path}/cache"},
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"},
+            "broken": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": str(tmp_path / "missing" / "db.sqlite3"),
+            },
+        },
+    )
+
+    report = warmup.warm_up()
+
+    assert report["ready"] is False
+    assert report["databases"]["default"]["ready"] is True
+    assert connections["default"].connection is not None
+    assert report["databases"]["broken"]["ready"] is False
+    assert report["databases"]["broken"]["error"].startswith("OperationalError")
+    assert report["caches"] == {
+        "default": {
+            "ready": True,
+            "seconds": report["caches"]["default"]["seconds"],
+            "error": None,
+        }
+    }
+    assert warmup.last_report() is report
+
+
+def test_warm_up_timeout(configure_settings, reset_connections, silent_server):
+    configure_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+            "slow": {
+                "BACKEND": "test_warmup.SocketCache",
+                "LOCATION": silent_server,
+                "OPTIONS": {"timeout": 0.2},
+            },
+        },
+    )
+
+    report = warmup.warm_up(databases=[])
+
+    assert report["caches"]["default"]["ready"] is True
+    slow = report["caches"]["slow"]
+    assert slow["ready"] is False
+    assert slow["seconds"] == pytest.approx(0.2, abs=0.05)
+    assert slow["error"].endswith("timed out")
+    # Every connection attempt has finished.
+    assert not any(thread.name.startswith("warmup") for thread in threading.enumerate())
+
+
+def test_setup_doesnt_warm_up(configure_settings, reset_connections, monkeypatch):
+    # Connections opened before forking would be shared by the workers.
+    monkeypatch.setattr(warmup, "_last_report", None)
+
+    assert SetUp().configure()
+    assert warmup.last_report() is None